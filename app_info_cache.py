@@ -0,0 +1,193 @@
+"""
+Persistent Steam app-info cache for descriptions and user tags.
+
+Store pages are the most expensive thing the deal detector fetches, and the
+description/tags of an app hardly ever change. This keeps them in a small
+SQLite file next to the scripts, keyed by app ID, with a TTL per field and an
+LRU cap on the number of apps kept.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+APP_INFO_CACHE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    ".steam_app_info_cache.sqlite3",
+)
+# Store descriptions are rewritten rarely; user tags drift a little faster.
+DESCRIPTION_TTL_SECONDS = 30 * 86400
+TAGS_TTL_SECONDS = 7 * 86400
+# Least recently used apps are evicted past this many rows.
+APP_INFO_CACHE_MAX_ENTRIES = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS app_info (
+    app_id INTEGER PRIMARY KEY,
+    description TEXT,
+    description_at REAL,
+    tags TEXT,
+    tags_at REAL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS app_info_last_used ON app_info (last_used);
+"""
+
+
+class AppInfoCache:
+    """SQLite-backed {'description', 'tags'} cache keyed by Steam app ID.
+
+    Safe to share between threads. Any SQLite error (read-only folder, locked
+    or corrupt file) disables the cache for the process instead of raising.
+    """
+
+    def __init__(
+        self,
+        path: str = APP_INFO_CACHE_FILE,
+        description_ttl: float = DESCRIPTION_TTL_SECONDS,
+        tags_ttl: float = TAGS_TTL_SECONDS,
+        max_entries: int = APP_INFO_CACHE_MAX_ENTRIES,
+    ):
+        self.path = path
+        self.description_ttl = description_ttl
+        self.tags_ttl = tags_ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None or self._disabled:
+            return self._conn
+        try:
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            conn.commit()
+        except sqlite3.Error as exc:
+            print(f"App info cache unavailable ({exc}); fetching store pages directly.")
+            self._disabled = True
+            return None
+        self._conn = conn
+        return conn
+
+    def _fresh_fields(self, row, now: float) -> Dict:
+        _app_id, description, description_at, tags, tags_at = row
+        info: Dict = {}
+        if description and description_at and now - description_at < self.description_ttl:
+            info["description"] = description
+        if tags is not None and tags_at and now - tags_at < self.tags_ttl:
+            try:
+                info["tags"] = json.loads(tags)
+            except ValueError:
+                pass
+        return info
+
+    def get_many(self, app_ids: Iterable[int]) -> Dict[int, Dict]:
+        """Return {app_id: info} for apps with at least one unexpired field.
+
+        ``info`` only contains the fields that are still fresh, so callers can
+        tell "description cached, tags expired" apart from a full hit.
+        """
+        ids: List[int] = sorted({int(app_id) for app_id in app_ids if app_id})
+        if not ids:
+            return {}
+        now = time.time()
+        found: Dict[int, Dict] = {}
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return {}
+            try:
+                placeholders = ",".join("?" for _ in ids)
+                rows = conn.execute(
+                    "SELECT app_id, description, description_at, tags, tags_at "
+                    f"FROM app_info WHERE app_id IN ({placeholders})",
+                    ids,
+                ).fetchall()
+                for row in rows:
+                    info = self._fresh_fields(row, now)
+                    if info:
+                        found[row[0]] = info
+                if found:
+                    conn.executemany(
+                        "UPDATE app_info SET last_used = ? WHERE app_id = ?",
+                        [(now, app_id) for app_id in found],
+                    )
+                    conn.commit()
+            except sqlite3.Error:
+                return {}
+        return found
+
+    def get(self, app_id: Optional[int]) -> Optional[Dict]:
+        if not app_id:
+            return None
+        return self.get_many([app_id]).get(int(app_id))
+
+    def put(
+        self,
+        app_id: Optional[int],
+        description: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> None:
+        """Store whichever fields are given; omitted fields keep their old value."""
+        if not app_id or (description is None and tags is None):
+            return
+        now = time.time()
+        tags_json = json.dumps(list(tags)) if tags is not None else None
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    """
+                    INSERT INTO app_info (app_id, description, description_at, tags, tags_at, last_used)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(app_id) DO UPDATE SET
+                        description = COALESCE(excluded.description, app_info.description),
+                        description_at = COALESCE(excluded.description_at, app_info.description_at),
+                        tags = COALESCE(excluded.tags, app_info.tags),
+                        tags_at = COALESCE(excluded.tags_at, app_info.tags_at),
+                        last_used = excluded.last_used
+                    """,
+                    (
+                        int(app_id),
+                        description,
+                        now if description is not None else None,
+                        tags_json,
+                        now if tags_json is not None else None,
+                        now,
+                    ),
+                )
+                self._evict(conn)
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (count,) = conn.execute("SELECT COUNT(*) FROM app_info").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM app_info WHERE app_id IN ("
+                "SELECT app_id FROM app_info ORDER BY last_used ASC LIMIT ?)",
+                (overflow,),
+            )
+
+
+_SHARED_CACHE: Optional[AppInfoCache] = None
+_SHARED_CACHE_LOCK = threading.Lock()
+
+
+def get_app_info_cache() -> AppInfoCache:
+    """Process-wide cache instance (the web interface builds a detector per request)."""
+    global _SHARED_CACHE
+    with _SHARED_CACHE_LOCK:
+        if _SHARED_CACHE is None:
+            _SHARED_CACHE = AppInfoCache()
+        return _SHARED_CACHE
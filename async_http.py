@@ -0,0 +1,340 @@
+"""
+Shared asyncio HTTP engine for the deal detectors.
+
+One event loop runs on a background daemon thread for the whole process, so
+pooled connections survive between refreshes and synchronous callers
+(``bot.py``, ``manual_poster.py``, the Flask views) can submit coroutines
+with ``engine.run(...)``. Async callers on any other loop can ``await`` the
+engine methods directly; the actual I/O is always done on the engine loop.
+
+With ``aiohttp`` installed requests go through one pooled ``ClientSession``.
+Without it, a pooled ``requests.Session`` is driven from worker threads, so
+fan-out still works on a plain ``requirements.txt`` install.
+
+Sessions come from ``http_client.build_session`` and every request is
+reported to the ``http_client`` metrics hooks. Every GET follows the host's
+``http_policy.HostPolicy``: rate limited, retried on 429/5xx and dropped
+connections, and its per-host concurrency shrinks while the host answers
+429. Endpoints whose circuit breaker is open fail straight away with
+``http_policy.CircuitOpenError``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+from urllib.parse import urlparse
+
+import requests
+
+from http_client import build_session, emit_metrics
+from http_policy import (
+    RETRY_AFTER_MAX,
+    RETRY_ATTEMPTS,
+    RETRY_STATUSES,
+    CircuitOpenError,
+    breaker_counts_status,
+    get_circuit_breakers,
+    get_host_policy,
+    parse_retry_after,
+    retry_delay,
+)
+
+try:
+    import aiohttp  # type: ignore[import-not-found]
+    _HAS_AIOHTTP = True
+except Exception:
+    aiohttp = None  # type: ignore
+    _HAS_AIOHTTP = False
+
+# Requests in flight at once across every host (blocking jobs get as many
+# slots of their own, so a job waiting on the engine can't starve it).
+ASYNC_MAX_CONCURRENCY = 16
+# Requests in flight at once to a single host.
+ASYNC_PER_HOST_LIMIT = 6
+
+T = TypeVar("T")
+
+# Marks a response that should be retried instead of returned.
+_RETRY = object()
+
+
+def _connection_errors():
+    errors = (requests.ConnectionError,)
+    if _HAS_AIOHTTP:
+        errors += (aiohttp.ClientConnectionError,)
+    return errors
+
+
+def _error_status(error: BaseException) -> Optional[int]:
+    """HTTP status carried by a requests / aiohttp error, if any."""
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is None and _HAS_AIOHTTP and isinstance(error, aiohttp.ClientResponseError):
+        status = error.status
+    return status
+
+
+def _should_retry(status: int, retry_after: Optional[float], retry_by: Optional[float]) -> bool:
+    """Retry only if the next attempt can still start before `retry_by`
+    (a monotonic time; None = this was the last attempt)."""
+    if retry_by is None or status not in RETRY_STATUSES:
+        return False
+    time_left = retry_by - time.monotonic()
+    if time_left <= 0:
+        return False
+    # Don't wait out a Retry-After longer than the request itself may take.
+    return retry_after is None or retry_after <= min(RETRY_AFTER_MAX, time_left)
+
+
+class _AdaptiveHostSlot:
+    """Per-host concurrency gate whose size follows the host's policy."""
+
+    def __init__(self, policy, cap: int):
+        self.policy = policy
+        self.cap = cap
+        self._in_flight = 0
+        self._changed = asyncio.Condition()
+
+    def _limit(self) -> int:
+        return max(1, min(self.cap, self.policy.concurrency))
+
+    async def __aenter__(self):
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._in_flight < self._limit())
+            self._in_flight += 1
+
+    async def __aexit__(self, *exc_info):
+        async with self._changed:
+            self._in_flight -= 1
+            self._changed.notify_all()
+
+
+class AsyncHTTPEngine:
+    """Pooled GET client with a global and a per-host concurrency limit."""
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        cookies: Optional[Dict[str, str]] = None,
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+        per_host_limit: int = ASYNC_PER_HOST_LIMIT,
+    ):
+        self.headers = dict(headers or {})
+        self.cookies = dict(cookies or {})
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._atexit_registered = False
+        # Created on the engine loop the first time they are needed.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._blocking_semaphore: Optional[asyncio.Semaphore] = None
+        self._host_slots: Dict[str, _AdaptiveHostSlot] = {}
+        self._client = None
+        self._session: Optional[requests.Session] = None
+
+    # -- event loop ---------------------------------------------------------
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                # Room for every request slot plus every blocking-job slot.
+                loop.set_default_executor(ThreadPoolExecutor(
+                    max_workers=self.max_concurrency * 2,
+                    thread_name_prefix="async-http-worker",
+                ))
+                thread = threading.Thread(
+                    target=loop.run_forever, name="async-http-engine", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+                if not self._atexit_registered:
+                    atexit.register(self.close)
+                    self._atexit_registered = True
+            return self._loop
+
+    def run(self, coro: Awaitable[T]) -> T:
+        """Run `coro` on the engine loop and block until it finishes."""
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("engine.run() called from the engine loop; await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def _on_engine_loop(self, coro: Awaitable[T]) -> T:
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    def _slots(self, url: str):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        host = urlparse(url).netloc.lower()
+        host_slot = self._host_slots.get(host)
+        if host_slot is None:
+            host_slot = _AdaptiveHostSlot(get_host_policy(url), self.per_host_limit)
+            self._host_slots[host] = host_slot
+        return self._semaphore, host_slot
+
+    # -- transports -----------------------------------------------------------
+
+    def _requests_session(self) -> requests.Session:
+        if self._session is None:
+            self._session = build_session(
+                self.headers,
+                self.cookies,
+                pool_maxsize=self.max_concurrency,
+                pool_connections=self.max_concurrency,
+            )
+        return self._session
+
+    def _aiohttp_client(self):
+        if self._client is None or self._client.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency, limit_per_host=self.per_host_limit
+            )
+            self._client = aiohttp.ClientSession(
+                connector=connector, headers=self.headers, cookies=self.cookies
+            )
+        return self._client
+
+    async def _fetch_once(self, policy, url: str, params, timeout: float, as_json: bool, retry_by):
+        """One GET; returns the body, or _RETRY for a retryable response
+        (only while another attempt fits before `retry_by`)."""
+        if _HAS_AIOHTTP:
+            client = self._aiohttp_client()
+            async with client.get(
+                url, params=params, timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                policy.record(response.status, retry_after)
+                if _should_retry(response.status, retry_after, retry_by):
+                    return _RETRY, retry_after
+                response.raise_for_status()
+                if as_json:
+                    return await response.json(content_type=None), None
+                return await response.text(), None
+
+        def fetch():
+            response = self._requests_session().get(url, params=params, timeout=timeout)
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            policy.record(response.status_code, retry_after)
+            if _should_retry(response.status_code, retry_after, retry_by):
+                response.close()
+                return _RETRY, retry_after
+            response.raise_for_status()
+            return (response.json() if as_json else response.text), None
+
+        return await asyncio.to_thread(fetch)
+
+    async def _get(self, url: str, params, timeout: float, as_json: bool):
+        params = {key: str(value) for key, value in (params or {}).items()}
+        breakers = get_circuit_breakers()
+        start = time.perf_counter()
+        try:
+            # The breakers read and write the state file: keep that off the
+            # loop (and out of the blocking-job slots, which may be waiting on
+            # this very request).
+            await asyncio.to_thread(breakers.check, url)
+            body = await self._get_with_retries(url, params, timeout, as_json)
+        except asyncio.CancelledError:
+            # The caller gave up (deadline); says nothing about the endpoint.
+            breakers.release(url)
+            raise
+        except Exception as e:
+            status = _error_status(e)
+            if not isinstance(e, CircuitOpenError):
+                await asyncio.to_thread(
+                    breakers.record, url, ok=not breaker_counts_status(status)
+                )
+            emit_metrics("GET", url, status, time.perf_counter() - start, error=e)
+            raise
+        await asyncio.to_thread(breakers.record, url, ok=True)
+        emit_metrics("GET", url, 200, time.perf_counter() - start)
+        return body
+
+    async def _get_with_retries(self, url: str, params, timeout: float, as_json: bool):
+        """`timeout` bounds the whole request: rate-limit waits, every
+        attempt and the backoff between them."""
+        policy = get_host_policy(url)
+        semaphore, host_slot = self._slots(url)
+        ends_at = time.monotonic() + timeout
+        for attempt in range(RETRY_ATTEMPTS):
+            # Backoff drawn up front, so an attempt knows whether a retry fits.
+            backoff = retry_delay(attempt)
+            retry_by = ends_at - backoff if attempt < RETRY_ATTEMPTS - 1 else None
+            wait = policy.reserve()
+            if wait > 0:
+                if time.monotonic() + wait >= ends_at:
+                    raise asyncio.TimeoutError(f"{url}: rate limited past the request timeout")
+                await asyncio.sleep(wait)
+            try:
+                async with semaphore, host_slot:
+                    body, retry_after = await self._fetch_once(
+                        policy, url, params, max(0.1, ends_at - time.monotonic()), as_json, retry_by
+                    )
+            except _connection_errors() as e:
+                # A request that timed out already used its whole budget.
+                if (
+                    retry_by is None
+                    or time.monotonic() >= retry_by
+                    or isinstance(e, (asyncio.TimeoutError, requests.Timeout))
+                ):
+                    raise
+                policy.record(None)
+                body, retry_after = _RETRY, None
+            if body is not _RETRY:
+                return body
+            policy.record_retry()
+            await asyncio.sleep(max(backoff, retry_after or 0))
+
+    async def _run_blocking(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        if self._blocking_semaphore is None:
+            self._blocking_semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._blocking_semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    # -- public API -----------------------------------------------------------
+
+    async def get_text(self, url: str, params=None, timeout: float = 10) -> str:
+        """GET `url` and return the body text (raises on HTTP errors)."""
+        return await self._on_engine_loop(self._get(url, params, timeout, as_json=False))
+
+    async def get_json(self, url: str, params=None, timeout: float = 10):
+        """GET `url` and return the decoded JSON body (raises on HTTP errors)."""
+        return await self._on_engine_loop(self._get(url, params, timeout, as_json=True))
+
+    async def run_blocking(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking call (third-party client, legacy scraper) in a worker
+        thread, at most `max_concurrency` at a time."""
+        return await self._on_engine_loop(self._run_blocking(func, *args, **kwargs))
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.closed:
+            await self._client.close()
+        self._client = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def close(self) -> None:
+        """Close pooled connections and stop the engine loop."""
+        loop = self._loop
+        if loop is None or not loop.is_running():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.aclose(), loop).result(timeout=5)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        with self._start_lock:
+            self._loop = self._thread = None
+            self._semaphore = self._blocking_semaphore = None
+            self._host_slots = {}
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Steam search-results parser on saved fixtures.
+
+Three implementations are timed on every fixture:
+
+- baseline: ``SteamDealDetector._parse_search_results_html`` as it was
+  before the lxml parser (BeautifulSoup with CSS selectors per row and
+  uncompiled regexes, building plain dicts), copied below verbatim;
+- soup: the current BeautifulSoup fallback used when lxml is missing;
+- lxml: the current single-pass lxml row parser.
+
+It checks that all three find the same deals (name, discount, prices, URL)
+and prints the per-page times and the lxml speedup over the baseline.
+
+Usage:
+  python benchmarks/bench_search_parser.py [--runs 50]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("STEAMDEALBOT_NO_COLOR", "1")
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+import steam_deals  # noqa: E402
+
+# Fields every implementation fills the same way.
+COMPARED_FIELDS = ("name", "discount", "price", "original_price", "steam_url")
+
+
+# -- baseline parser (copied from steam_deals.py before the lxml rewrite) -----
+
+def _baseline_clean_game_name(game_name):
+    """Clean up game name by removing extra text."""
+    game_name = re.sub(r'\s+', ' ', game_name).strip()
+    game_name = re.sub(r'\s*\d{1,2}\s+\w{3,9},?\s+\d{4}.*$', '', game_name)
+    game_name = re.sub(r'\s*-\d+%.*$', '', game_name)
+    game_name = re.sub(r'\s*Rp\s*\d+.*$', '', game_name)
+    game_name = game_name.strip()
+    return game_name
+
+
+def baseline_parse_search_results_html(results_html, source_label=steam_deals.DEFAULT_SOURCE_LABEL):
+    """Parse the 'results_html' fragment into deal dicts (no description)."""
+    soup = BeautifulSoup(results_html, 'html.parser')
+    deals = []
+
+    for row in soup.select('a.search_result_row'):
+        try:
+            title_elem = row.select_one('span.title')
+            if not title_elem:
+                continue
+            game_name = _baseline_clean_game_name(title_elem.get_text(strip=True))
+            if len(game_name) < 3:
+                continue
+
+            discount_elem = row.select_one('div.discount_pct')
+            discount = discount_elem.get_text(strip=True) if discount_elem else None
+            if not discount or not re.search(r'-\d+%', discount):
+                continue
+            discount = re.search(r'(-\d+%)', discount).group(1)
+
+            price_elem = row.select_one('div.discount_final_price')
+            price_match = re.search(r'(\$\d[\d,]*\.?\d*)', price_elem.get_text()) if price_elem else None
+            if not price_match:
+                continue
+            price = price_match.group(1)
+
+            orig_elem = row.select_one('div.discount_original_price')
+            orig_match = re.search(r'(\$\d[\d,]*\.?\d*)', orig_elem.get_text()) if orig_elem else None
+            original_price = orig_match.group(1) if orig_match else None
+
+            steam_url = (row.get('href') or '').split('?')[0]
+            appid = row.get('data-ds-appid')
+            if appid and '/app/' not in steam_url:
+                steam_url = f"https://store.steampowered.com/app/{appid}/"
+            if not steam_url:
+                continue
+
+            deals.append({
+                'name': game_name,
+                'discount': discount,
+                'price': price,
+                'original_price': original_price,
+                'source': source_label,
+                'description': None,
+                'steam_url': steam_url,
+                'tags': [],
+            })
+        except Exception:
+            continue
+
+    return deals
+
+
+# -- timing --------------------------------------------------------------------
+
+def time_function(parse, results_html, runs):
+    deals = parse(results_html)
+    start = time.perf_counter()
+    for _ in range(runs):
+        parse(results_html)
+    elapsed = (time.perf_counter() - start) / runs
+    return elapsed, [tuple(deal.get(field) for field in COMPARED_FIELDS) for deal in deals]
+
+
+def time_current(detector, results_html, runs, use_lxml):
+    steam_deals._HAS_LXML = use_lxml
+    return time_function(detector._parse_search_results_html, results_html, runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=50, help="parses per fixture and parser")
+    args = parser.parse_args()
+
+    if not steam_deals._HAS_LXML:
+        print("lxml is not installed; nothing to compare (pip install lxml).")
+        return 1
+
+    detector = steam_deals.SteamDealDetector()
+    fixtures = sorted(FIXTURES_DIR.glob("search_results_*.json"))
+    if not fixtures:
+        print(f"No fixtures found in {FIXTURES_DIR}")
+        return 1
+
+    print("baseline = pre-lxml BeautifulSoup parser, soup = current fallback, lxml = current parser")
+    print(
+        f"{'fixture':32} {'rows':>5} {'baseline ms':>12} {'soup ms':>9} {'lxml ms':>9} "
+        f"{'speedup':>8}"
+    )
+    for path in fixtures:
+        with open(path, encoding="utf-8") as fixture_file:
+            results_html = json.load(fixture_file)["results_html"]
+
+        base_time, base_deals = time_function(
+            baseline_parse_search_results_html, results_html, args.runs
+        )
+        soup_time, soup_deals = time_current(detector, results_html, args.runs, use_lxml=False)
+        lxml_time, lxml_deals = time_current(detector, results_html, args.runs, use_lxml=True)
+        for label, deals in (("soup", soup_deals), ("lxml", lxml_deals)):
+            if deals != base_deals:
+                print(
+                    f"{path.name}: {label} disagrees with the baseline "
+                    f"({len(deals)} vs {len(base_deals)} deals)"
+                )
+                return 1
+
+        print(
+            f"{path.name:32} {len(lxml_deals):>5} {base_time * 1000:>12.2f} "
+            f"{soup_time * 1000:>9.2f} {lxml_time * 1000:>9.2f} {base_time / lxml_time:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
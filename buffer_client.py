@@ -12,6 +12,9 @@ from typing import Any, Dict, List, Optional
 
 import requests
 
+from http_client import get_http_client
+from http_policy import RATE_LIMITED_STATUSES
+
 BUFFER_API_URL = "https://api.buffer.com"
 # Prefer X/Twitter when several channels exist; fall back to first channel.
 PREFERRED_CHANNEL_SERVICES = ("twitter", "x")
@@ -66,8 +69,11 @@ class BufferClient:
         payload: Dict[str, Any] = {"query": query}
         if variables is not None:
             payload["variables"] = variables
-        response = requests.post(
+        # createPost isn't idempotent: only retry when Buffer rate-limits us.
+        response = get_http_client().post(
             BUFFER_API_URL,
+            retry_statuses=RATE_LIMITED_STATUSES,
+            retry_connection_errors=False,
             headers=self._headers(),
             json=payload,
             timeout=self.timeout,
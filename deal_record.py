@@ -0,0 +1,339 @@
+"""
+Compact deal record shared by the Steam and Nintendo detectors.
+
+Prices and discounts are parsed once, when a deal is built, into integer
+cents / percent, so sorting, filtering and price bucketing never re-run
+regexes. ``Deal`` still behaves like the plain dicts deals used to be
+(``deal["price"]``, ``deal.get("tags")``, ``deal["source"] = ...``), so the
+manual poster and web interface keep working unchanged.
+
+A deal can also carry deferred enrichment (``Deal.defer``): the resolver
+runs once, the first time a formatter reads an empty description, tags or
+time-left, so deals that are never shown never cost a request.
+
+Sale end times are kept as raw Unix timestamps (``discount_expiration``) and
+``time_left`` is rendered from them on every read, so a deal that was fetched
+an hour ago still shows the right countdown.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import MutableMapping
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+_PRICE_RE = re.compile(r"(\d[\d,]*)(?:\.(\d{1,2}))?")
+_DISCOUNT_RE = re.compile(r"(\d+)")
+_STEAM_APP_RE = re.compile(r"store\.steampowered\.com/app/(\d+)")
+
+
+def parse_price_cents(text) -> Optional[int]:
+    """'$1,299.99' -> 129999. Returns None when no price is found."""
+    if text is None:
+        return None
+    if isinstance(text, (int, float)):
+        return int(round(float(text) * 100))
+    match = _PRICE_RE.search(str(text))
+    if not match:
+        return None
+    dollars = int(match.group(1).replace(",", ""))
+    cents = (match.group(2) or "0").ljust(2, "0")
+    return dollars * 100 + int(cents)
+
+
+def format_price_cents(cents: Optional[int]) -> Optional[str]:
+    """129999 -> '$1,299.99'."""
+    if cents is None:
+        return None
+    return f"${cents // 100:,}.{cents % 100:02d}"
+
+
+def parse_discount_percent(text) -> int:
+    """'-75%' -> 75. Returns 0 when no number is found."""
+    if text is None:
+        return 0
+    if isinstance(text, int):
+        return abs(text)
+    match = _DISCOUNT_RE.search(str(text))
+    return int(match.group(1)) if match else 0
+
+
+def steam_app_id_from_url(url) -> Optional[int]:
+    match = _STEAM_APP_RE.search(url or "")
+    return int(match.group(1)) if match else None
+
+
+def time_left_text(end_dt: datetime) -> str:
+    """Render the time until `end_dt` as '3d left', '5 hours left', ..."""
+    if end_dt.tzinfo is None:
+        now = datetime.now()
+    else:
+        now = datetime.now(end_dt.tzinfo)
+    remaining = end_dt - now
+    if remaining.total_seconds() <= 0:
+        return "ended"
+
+    total_hours = int(remaining.total_seconds() // 3600)
+    total_days = total_hours // 24
+    if total_days >= 1:
+        return f"{total_days}d left"
+    if total_hours >= 2:
+        return f"{total_hours} hours left"
+    total_minutes = int(remaining.total_seconds() // 60)
+    if total_minutes >= 2:
+        return f"{total_minutes} minutes left"
+    return "ending soon"
+
+
+def time_left_from_unix(unix_seconds) -> Optional[str]:
+    if not unix_seconds:
+        return None
+    try:
+        end_dt = datetime.fromtimestamp(int(unix_seconds))
+    except Exception:
+        return None
+    return time_left_text(end_dt)
+
+
+class Deal(MutableMapping):
+    """One discounted game with numeric price fields and a dict-style view.
+
+    ``price`` / ``original_price`` / ``discount`` are rendered from the
+    integer fields on read and parsed back on assignment. Unknown keys are
+    kept in a small side dict so callers can still attach ad-hoc data.
+    """
+
+    __slots__ = (
+        "name",
+        "price_cents",
+        "original_price_cents",
+        "discount_pct",
+        "source",
+        "description",
+        "steam_url",
+        "app_id",
+        "nsuid",
+        "tags",
+        "tag_ids",
+        "discount_expiration",
+        "_time_left_text",
+        "item_type",
+        "review_summary",
+        "review_percent",
+        "review_count",
+        "_resolver",
+        "_extra",
+    )
+
+    # Keys exposed through the mapping interface, in their usual order.
+    KEYS = (
+        "name",
+        "discount",
+        "price",
+        "original_price",
+        "source",
+        "time_left",
+        "discount_expiration",
+        "description",
+        "steam_url",
+        "nsuid",
+        "tags",
+        "tag_ids",
+        "item_type",
+        "review_summary",
+        "review_percent",
+        "review_count",
+    )
+    # Keys a deferred resolver fills in when they are first read empty.
+    LAZY_KEYS = ("description", "tags", "time_left")
+
+    def __init__(
+        self,
+        name: str,
+        price_cents: int,
+        discount_pct: int = 0,
+        original_price_cents: Optional[int] = None,
+        source: str = "",
+        description: Optional[str] = None,
+        steam_url: str = "",
+        nsuid: str = "",
+        tags: Optional[List[str]] = None,
+        time_left: Optional[str] = None,
+        tag_ids: Optional[List[int]] = None,
+        item_type: Optional[str] = None,
+        review_summary: Optional[str] = None,
+        review_percent: Optional[int] = None,
+        review_count: Optional[int] = None,
+        discount_expiration: Optional[int] = None,
+        **extra: Any,
+    ):
+        self.name = name
+        self.price_cents = int(price_cents)
+        self.discount_pct = int(discount_pct)
+        self.original_price_cents = (
+            int(original_price_cents) if original_price_cents is not None else None
+        )
+        self.source = source
+        self.description = description
+        self.steam_url = steam_url
+        self.app_id = steam_app_id_from_url(steam_url)
+        self.nsuid = str(nsuid or "").strip()
+        self.tags = list(tags) if tags else []
+        self.discount_expiration = int(discount_expiration) if discount_expiration else None
+        self._time_left_text = time_left
+        self.tag_ids = list(tag_ids) if tag_ids else []
+        self.item_type = item_type
+        self.review_summary = review_summary
+        self.review_percent = review_percent
+        self.review_count = review_count
+        self._resolver = None
+        self._extra: Optional[Dict[str, Any]] = dict(extra) if extra else None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Deal":
+        """Build a Deal from the legacy dict shape ('$9.99', '-75%' strings)."""
+        if isinstance(data, Deal):
+            return data
+        values = dict(data)
+        price_cents = parse_price_cents(values.pop("price", None))
+        deal = cls(
+            name=values.pop("name"),
+            price_cents=price_cents if price_cents is not None else 0,
+            discount_pct=parse_discount_percent(values.pop("discount", None)),
+            original_price_cents=parse_price_cents(values.pop("original_price", None)),
+        )
+        for key, value in values.items():
+            deal[key] = value
+        return deal
+
+    # -- deferred enrichment ----------------------------------------------------
+
+    def defer(self, resolver: Optional[Callable[["Deal"], None]]) -> None:
+        """Attach (or with None, drop) a one-shot enrichment callback."""
+        self._resolver = resolver
+
+    @property
+    def deferred(self) -> bool:
+        return self._resolver is not None
+
+    def resolve(self) -> "Deal":
+        """Run the deferred resolver now, if there still is one."""
+        resolver, self._resolver = self._resolver, None
+        if resolver is not None:
+            resolver(self)
+        return self
+
+    # -- rendered string fields -------------------------------------------------
+
+    @property
+    def price(self) -> str:
+        return format_price_cents(self.price_cents)
+
+    @property
+    def original_price(self) -> Optional[str]:
+        return format_price_cents(self.original_price_cents)
+
+    @property
+    def discount(self) -> str:
+        return f"-{self.discount_pct}%"
+
+    @property
+    def time_left(self) -> Optional[str]:
+        """Countdown text, recomputed from `discount_expiration` when known."""
+        if self.discount_expiration:
+            return time_left_from_unix(self.discount_expiration)
+        return self._time_left_text
+
+    @time_left.setter
+    def time_left(self, value: Optional[str]) -> None:
+        self._time_left_text = value
+
+    # -- mapping interface ----------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        if key in Deal.KEYS:
+            value = getattr(self, key)
+            if self._resolver is not None and key in Deal.LAZY_KEYS and value in (None, "", []):
+                self.resolve()
+                value = getattr(self, key)
+            return value
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == "price":
+            cents = parse_price_cents(value)
+            self.price_cents = cents if cents is not None else 0
+        elif key == "original_price":
+            self.original_price_cents = parse_price_cents(value)
+        elif key == "discount":
+            self.discount_pct = parse_discount_percent(value)
+        elif key == "steam_url":
+            self.steam_url = value or ""
+            self.app_id = steam_app_id_from_url(self.steam_url)
+        elif key == "nsuid":
+            self.nsuid = str(value or "").strip()
+        elif key in ("tags", "tag_ids"):
+            setattr(self, key, list(value) if value else [])
+        elif key == "discount_expiration":
+            self.discount_expiration = int(value) if value else None
+        elif key in Deal.KEYS:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in ("name", "price", "discount"):
+            raise KeyError(f"{key} is required on a Deal")
+        if key in Deal.KEYS:
+            self[key] = None
+            return
+        if not self._extra or key not in self._extra:
+            raise KeyError(key)
+        del self._extra[key]
+
+    def _has_raw(self, key: str) -> bool:
+        # Reads the raw fields, so it never triggers a deferred fetch.
+        if key in Deal.KEYS:
+            return getattr(self, key) not in (None, "", []) or key in ("name", "discount", "price")
+        return bool(self._extra) and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for key in Deal.KEYS:
+            if self._has_raw(key):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._has_raw(key)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def copy(self) -> "Deal":
+        """Independent copy of the raw fields; never runs the resolver.
+
+        A deferred deal's copy keeps the resolver, so it stays lazy too
+        (resolving one copy doesn't fill the other).
+        """
+        clone = Deal.__new__(Deal)
+        for slot in Deal.__slots__:
+            setattr(clone, slot, getattr(self, slot))
+        clone.tags = list(self.tags)
+        clone.tag_ids = list(self.tag_ids)
+        clone._extra = dict(self._extra) if self._extra else None
+        return clone
+
+    def to_dict(self) -> Dict[str, Any]:
+        self.resolve()
+        return {key: self[key] for key in self}
+
+    def __repr__(self) -> str:
+        # Raw fields only: printing or logging a deal must not fetch anything.
+        fields = {key: getattr(self, key) if key in Deal.KEYS else self._extra[key] for key in self}
+        return f"Deal({fields!r}{', deferred' if self.deferred else ''})"
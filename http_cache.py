@@ -0,0 +1,186 @@
+"""
+On-disk HTTP validator cache for conditional GETs.
+
+Responses that carry an ``ETag`` or ``Last-Modified`` header are stored with
+their body in a small SQLite file next to the scripts. The next request for
+the same URL sends ``If-None-Match`` / ``If-Modified-Since``; a ``304 Not
+Modified`` is answered from the stored body (see
+``HTTPClient.fetch_conditional``), so unchanged news feeds and Steam
+endpoints cost a header round-trip instead of a full download.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from typing import NamedTuple, Optional
+
+HTTP_CACHE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    ".steamdealbot_http_cache.sqlite3",
+)
+# Entries not validated for this long are dropped instead of revalidated.
+HTTP_CACHE_MAX_AGE = 7 * 86400
+# Least recently used responses are evicted past this many rows.
+HTTP_CACHE_MAX_ENTRIES = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body BLOB NOT NULL,
+    validated_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+"""
+
+
+class CachedResponse(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+    validated_at: float
+
+    def validator_headers(self):
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """SQLite-backed validators + bodies keyed by request (URL and params).
+
+    Safe to share between threads. Any SQLite error disables the cache for
+    the process instead of raising; requests then go out unconditionally.
+    """
+
+    def __init__(
+        self,
+        path: str = HTTP_CACHE_FILE,
+        max_age: float = HTTP_CACHE_MAX_AGE,
+        max_entries: int = HTTP_CACHE_MAX_ENTRIES,
+    ):
+        self.path = path
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None or self._disabled:
+            return self._conn
+        try:
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            conn.commit()
+        except sqlite3.Error as exc:
+            print(f"HTTP cache unavailable ({exc}); downloading responses in full.")
+            self._disabled = True
+            return None
+        self._conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT etag, last_modified, body, validated_at FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                if now - row[3] >= self.max_age:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    conn.commit()
+                    return None
+                conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+                conn.commit()
+            except sqlite3.Error:
+                return None
+        etag, last_modified, body, validated_at = row
+        return CachedResponse(etag, last_modified, bytes(body), validated_at)
+
+    def put(self, key: str, etag: Optional[str], last_modified: Optional[str], body: bytes) -> None:
+        if not (etag or last_modified):
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    """
+                    INSERT INTO responses (key, etag, last_modified, body, validated_at, last_used)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET
+                        etag = excluded.etag,
+                        last_modified = excluded.last_modified,
+                        body = excluded.body,
+                        validated_at = excluded.validated_at,
+                        last_used = excluded.last_used
+                    """,
+                    (key, etag, last_modified, sqlite3.Binary(body), now, now),
+                )
+                self._evict(conn)
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def mark_validated(self, key: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Record a 304: the stored body is current (validators may be refreshed)."""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    """
+                    UPDATE responses SET
+                        etag = COALESCE(?, etag),
+                        last_modified = COALESCE(?, last_modified),
+                        validated_at = ?,
+                        last_used = ?
+                    WHERE key = ?
+                    """,
+                    (etag, last_modified, now, now, key),
+                )
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (count,) = conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY last_used ASC LIMIT ?)",
+                (overflow,),
+            )
+
+
+_SHARED_CACHE: Optional[HTTPCache] = None
+_SHARED_CACHE_LOCK = threading.Lock()
+
+
+def get_http_cache() -> HTTPCache:
+    """Process-wide HTTP validator cache."""
+    global _SHARED_CACHE
+    with _SHARED_CACHE_LOCK:
+        if _SHARED_CACHE is None:
+            _SHARED_CACHE = HTTPCache()
+        return _SHARED_CACHE
@@ -0,0 +1,273 @@
+"""
+One HTTP client for every subsystem (Steam, Nintendo, news feeds, Buffer).
+
+``get_http_client()`` hands out a process-wide ``HTTPClient`` that keeps one
+pooled ``requests.Session`` per host (keep-alive, tuned ``HTTPAdapter`` pool
+sizes, gzip/deflate and - when ``brotli`` is installed - br negotiation),
+sends every request through the shared retry / rate-limit / circuit-breaker
+policy in ``http_policy.py``, reports each request to the metrics hooks and
+can serve repeated GETs from a small in-memory response cache.
+``fetch_conditional`` adds ETag / Last-Modified revalidation against the
+on-disk ``http_cache.py`` and remembers the parsed result per response.
+
+The async engine (``async_http.py``) builds its sessions with
+``build_session`` and reports to the same hooks.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+from urllib.parse import urlencode, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_cache import HTTPCache, get_http_cache
+from http_policy import RETRY_STATUSES, request_with_retries
+
+try:
+    import brotli  # type: ignore[import-not-found]  # noqa: F401
+    _HAS_BROTLI = True
+except Exception:
+    try:
+        import brotlicffi  # type: ignore[import-not-found]  # noqa: F401
+        _HAS_BROTLI = True
+    except Exception:
+        _HAS_BROTLI = False
+
+# urllib3 only decodes br responses when a brotli package is importable.
+ACCEPT_ENCODING = "gzip, deflate, br" if _HAS_BROTLI else "gzip, deflate"
+# Keep-alive connections kept open per host.
+HTTP_POOL_MAXSIZE = 16
+# Host pools one session keeps (sessions are per host, redirects may add one).
+HTTP_POOL_CONNECTIONS = 4
+DEFAULT_TIMEOUT = 20
+RESPONSE_CACHE_MAX_ENTRIES = 64
+# Parsed results of conditional fetches kept in memory (one per URL).
+PARSED_CACHE_MAX_ENTRIES = 64
+
+T = TypeVar("T")
+
+MetricsHook = Callable[[Dict[str, Any]], None]
+_METRICS_HOOKS: List[MetricsHook] = []
+
+
+def add_metrics_hook(hook: MetricsHook) -> None:
+    """Call `hook(event)` after every request.
+
+    ``event`` has ``method``, ``url``, ``host``, ``status`` (None on error),
+    ``elapsed`` (seconds), ``cached`` and ``error`` (exception name or None).
+    """
+    if hook not in _METRICS_HOOKS:
+        _METRICS_HOOKS.append(hook)
+
+
+def remove_metrics_hook(hook: MetricsHook) -> None:
+    if hook in _METRICS_HOOKS:
+        _METRICS_HOOKS.remove(hook)
+
+
+def emit_metrics(method: str, url: str, status: Optional[int], elapsed: float,
+                 cached: bool = False, error: Optional[BaseException] = None) -> None:
+    if not _METRICS_HOOKS:
+        return
+    event = {
+        "method": method,
+        "url": url,
+        "host": urlparse(url).netloc.lower(),
+        "status": status,
+        "elapsed": elapsed,
+        "cached": cached,
+        "error": type(error).__name__ if error is not None else None,
+    }
+    for hook in list(_METRICS_HOOKS):
+        try:
+            hook(event)
+        except Exception:
+            pass
+
+
+def build_session(
+    headers: Optional[Dict[str, str]] = None,
+    cookies: Optional[Dict[str, str]] = None,
+    pool_maxsize: int = HTTP_POOL_MAXSIZE,
+    pool_connections: int = HTTP_POOL_CONNECTIONS,
+) -> requests.Session:
+    """A keep-alive session with the shared adapter and encoding settings.
+
+    urllib3 retries are off: retrying is ``http_policy``'s job.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    session.headers.update(headers or {})
+    for name, value in (cookies or {}).items():
+        session.cookies.set(name, value)
+    return session
+
+
+class HTTPClient:
+    """Pooled per-host sessions behind the shared HTTP policy."""
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, http_cache: Optional[HTTPCache] = None):
+        self.headers = dict(headers or {})
+        self.http_cache = http_cache or get_http_cache()
+        self._sessions: Dict[str, requests.Session] = {}
+        self._cache: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._parsed: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def session_for(self, url: str) -> requests.Session:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = build_session(self.headers)
+                self._sessions[host] = session
+            return session
+
+    def _cache_key(self, url: str, kwargs: Dict[str, Any]):
+        params = kwargs.get("params") or {}
+        return url, tuple(sorted((str(key), str(value)) for key, value in dict(params).items()))
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        cache_ttl: Optional[float] = None,
+        retry_statuses=RETRY_STATUSES,
+        retry_connection_errors: bool = True,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send a request; with `cache_ttl`, successful GETs are reused for that long.
+
+        Returns the response (callers ``raise_for_status()``) and raises
+        connection errors / ``http_policy.CircuitOpenError`` like requests.
+        """
+        method = method.upper()
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        cache_key = self._cache_key(url, kwargs) if cache_ttl and method == "GET" else None
+        if cache_key is not None:
+            with self._lock:
+                entry = self._cache.get(cache_key)
+                if entry and time.time() - entry[0] < cache_ttl:
+                    self._cache.move_to_end(cache_key)
+                    emit_metrics(method, url, entry[1].status_code, 0.0, cached=True)
+                    return entry[1]
+
+        start = time.perf_counter()
+        try:
+            response = request_with_retries(
+                self.session_for(url),
+                method,
+                url,
+                retry_statuses=retry_statuses,
+                retry_connection_errors=retry_connection_errors,
+                **kwargs,
+            )
+        except Exception as e:
+            emit_metrics(method, url, None, time.perf_counter() - start, error=e)
+            raise
+        emit_metrics(method, url, response.status_code, time.perf_counter() - start)
+
+        if cache_key is not None and response.ok:
+            with self._lock:
+                self._cache[cache_key] = (time.time(), response)
+                self._cache.move_to_end(cache_key)
+                while len(self._cache) > RESPONSE_CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def fetch_conditional(
+        self,
+        url: str,
+        parse: Callable[[bytes], T],
+        params: Optional[Dict[str, Any]] = None,
+        fresh_for: float = 0,
+        **kwargs: Any,
+    ) -> T:
+        """GET `url` with If-None-Match / If-Modified-Since and return `parse(body)`.
+
+        On a 304 the stored body is used, and while its validators are
+        unchanged the earlier parse result is returned without parsing again
+        (one `parse` per URL is assumed; treat the result as read-only). A
+        stored response validated less than `fresh_for` seconds ago is used
+        without a request. Raises like ``requests`` on HTTP errors.
+        """
+        key = url + ("?" + urlencode(sorted((params or {}).items())) if params else "")
+        cached = self.http_cache.get(key)
+        if cached is not None and fresh_for and time.time() - cached.validated_at < fresh_for:
+            return self._parsed_body(key, cached.etag, cached.last_modified, cached.body, parse)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if cached is not None:
+            headers.update(cached.validator_headers())
+        response = self.get(url, params=params, headers=headers, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            self.http_cache.mark_validated(key, etag, last_modified)
+            return self._parsed_body(
+                key, etag or cached.etag, last_modified or cached.last_modified, cached.body, parse
+            )
+        if response.status_code == 304:
+            # Nothing stored to fall back on (cache reset meanwhile); refetch in full.
+            headers.pop("If-None-Match", None)
+            headers.pop("If-Modified-Since", None)
+            response = self.get(url, params=params, headers=headers, **kwargs)
+        response.raise_for_status()
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        self.http_cache.put(key, etag, last_modified, response.content)
+        return self._parsed_body(key, etag, last_modified, response.content, parse)
+
+    def _parsed_body(self, key: str, etag, last_modified, body: bytes, parse: Callable[[bytes], T]) -> T:
+        validators = (etag, last_modified)
+        with self._lock:
+            entry = self._parsed.get(key)
+            if entry is not None and entry[0] == validators and any(validators):
+                self._parsed.move_to_end(key)
+                return entry[1]
+        parsed = parse(body)
+        if any(validators):
+            with self._lock:
+                self._parsed[key] = (validators, parsed)
+                self._parsed.move_to_end(key)
+                while len(self._parsed) > PARSED_CACHE_MAX_ENTRIES:
+                    self._parsed.popitem(last=False)
+        return parsed
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+            self._cache.clear()
+            self._parsed.clear()
+        for session in sessions:
+            session.close()
+
+
+_SHARED_CLIENT: Optional[HTTPClient] = None
+_SHARED_CLIENT_LOCK = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """Process-wide HTTP client."""
+    global _SHARED_CLIENT
+    with _SHARED_CLIENT_LOCK:
+        if _SHARED_CLIENT is None:
+            _SHARED_CLIENT = HTTPClient()
+        return _SHARED_CLIENT
@@ -0,0 +1,384 @@
+"""
+Shared HTTP retry / rate-limit policy.
+
+Every outgoing request to a host goes through that host's ``HostPolicy``:
+
+- a token bucket caps the request rate (``HOST_RATE_LIMITS``),
+- an adaptive concurrency limit is halved on every 429 and grows back by
+  one slot per ``ADAPTIVE_RECOVERY_SUCCESSES`` successful responses,
+- 429 / 5xx responses and dropped connections are retried with jittered
+  exponential backoff, waiting at least as long as ``Retry-After`` asks
+  (the whole host is paused for that long, not just the one request).
+
+On top of that, a circuit breaker per endpoint (host + path) counts requests
+that still failed after their retries. After ``BREAKER_FAILURE_THRESHOLD`` in
+a row the endpoint is skipped (``CircuitOpenError``, raised instantly) for a
+cool-down that doubles each time it re-opens; the state lives in the shared
+state file, so later runs skip it too. Once the cool-down is over the breaker
+is half-open: the next request goes through (on its caller's session, with the
+usual headers and cookies) while others are still skipped, and its result
+either closes the breaker or re-opens it for twice as long.
+The core Steam endpoints (``BREAKER_EXEMPT_ENDPOINTS``) are never skipped.
+
+The async engine (``async_http.py``) applies it to every Steam and Nintendo
+request; ``request_with_retries`` does the same for ``http_client.HTTPClient``,
+which news feeds, Buffer and the tag-list lookup use.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, FrozenSet, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from state_cache import get_state_cache
+
+# Attempts per request (the first try included).
+RETRY_ATTEMPTS = 3
+# Backoff before retry n is uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**n)).
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+# Longer Retry-After values are not waited out; the request fails instead.
+RETRY_AFTER_MAX = 30.0
+RETRY_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+# Non-idempotent calls (e.g. creating a Buffer post) only retry on this.
+RATE_LIMITED_STATUSES: FrozenSet[int] = frozenset({429})
+
+# (requests per second, burst, max concurrent requests) per host.
+DEFAULT_HOST_RATE_LIMIT = (5.0, 10, 6)
+HOST_RATE_LIMITS: Dict[str, Tuple[float, int, int]] = {
+    "store.steampowered.com": (10.0, 16, 6),
+    "api.steampowered.com": (10.0, 16, 6),
+    "ec.nintendo.com": (4.0, 8, 4),
+    "api.buffer.com": (1.0, 3, 1),
+}
+# Successful responses needed to add back one concurrency slot after a 429.
+ADAPTIVE_RECOVERY_SUCCESSES = 10
+
+# Failed requests in a row (after retries) before an endpoint is skipped.
+BREAKER_FAILURE_THRESHOLD = 3
+# First cool-down in seconds; doubled on every re-open, up to the max.
+BREAKER_COOLDOWN = 900
+BREAKER_COOLDOWN_MAX = 6 * 3600
+# Seconds a half-open request may stay unanswered before another is let through.
+BREAKER_HALF_OPEN_TIMEOUT = 60
+BREAKER_STATE_KEY = "circuit_breakers"
+# Responses that mean the endpoint itself is down or blocking us (429 and
+# other 4xx mean it is alive and just rejected this one request).
+BREAKER_FAILURE_STATUSES: FrozenSet[int] = frozenset({403, 404, 410})
+# Endpoints (host + path prefixes) never skipped: the Steam search, app
+# page and metadata endpoints every refresh depends on. A bad spell there
+# is ridden out with retries instead of hiding Steam deals for hours.
+BREAKER_EXEMPT_ENDPOINTS: Tuple[str, ...] = (
+    "store.steampowered.com/search",
+    "store.steampowered.com/app/",
+    "store.steampowered.com/api/",
+    "api.steampowered.com/IStoreBrowseService/",
+)
+
+
+class CircuitOpenError(requests.RequestException):
+    """The endpoint failed repeatedly and is being skipped for a while."""
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """Retry-After header (delta seconds or HTTP date) -> seconds, or None."""
+    if value in (None, ""):
+        return None
+    text = str(value).strip()
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def retry_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Seconds to wait before retry number `attempt` (0-based)."""
+    delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``reserve()`` says how long to wait."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request to this host for `seconds` (Retry-After)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class HostPolicy:
+    """Rate limit, adaptive concurrency and retry bookkeeping for one host."""
+
+    def __init__(self, host: str, rate: float, burst: int, max_concurrency: int):
+        self.host = host
+        self.bucket = TokenBucket(rate, burst)
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._concurrency = self.max_concurrency
+        self._successes = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._slot_free = threading.Condition(self._lock)
+        self.stats = {"requests": 0, "retries": 0, "rate_limited": 0, "errors": 0}
+
+    @property
+    def concurrency(self) -> int:
+        """Current adaptive limit on requests in flight to this host."""
+        return self._concurrency
+
+    def reserve(self) -> float:
+        return self.bucket.reserve()
+
+    def record(self, status: Optional[int], retry_after: Optional[float] = None) -> None:
+        """Feed a response status (None for a connection error) back in."""
+        with self._lock:
+            self.stats["requests"] += 1
+            if status == 429:
+                self.stats["rate_limited"] += 1
+                self._concurrency = max(1, self._concurrency // 2)
+                self._successes = 0
+            elif status is None or status >= 500:
+                self.stats["errors"] += 1
+            elif self._concurrency < self.max_concurrency:
+                self._successes += 1
+                if self._successes >= ADAPTIVE_RECOVERY_SUCCESSES:
+                    self._concurrency += 1
+                    self._successes = 0
+                    self._slot_free.notify_all()
+        if status == 429:
+            self.bucket.pause(retry_after if retry_after is not None else BACKOFF_BASE)
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.stats["retries"] += 1
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one of the host's adaptive concurrency slots (blocking threads)."""
+        with self._slot_free:
+            while self._in_flight >= self._concurrency:
+                self._slot_free.wait()
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._slot_free:
+                self._in_flight -= 1
+                self._slot_free.notify()
+
+
+def breaker_counts_status(status: Optional[int]) -> bool:
+    """True when `status` (None = no response at all) should trip a breaker."""
+    return status is None or status >= 500 or status in BREAKER_FAILURE_STATUSES
+
+
+def _endpoint(url: str) -> str:
+    parts = urlparse(url)
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}"
+
+
+def breaker_exempt(endpoint: str) -> bool:
+    return endpoint.startswith(BREAKER_EXEMPT_ENDPOINTS)
+
+
+class CircuitBreakers:
+    """Per-endpoint failure counters, shared with other runs via the state file."""
+
+    def __init__(self, state=None):
+        self.state = state or get_state_cache()
+        self._lock = threading.Lock()
+        # endpoint -> monotonic start of its in-flight half-open request
+        self._half_open: Dict[str, float] = {}
+
+    def _records(self) -> Dict[str, Dict]:
+        records = self.state.get(BREAKER_STATE_KEY, float("inf"), {})
+        return dict(records) if isinstance(records, dict) else {}
+
+    def check(self, url: str) -> None:
+        """Raise CircuitOpenError if `url`'s endpoint is currently skipped.
+
+        After the cool-down one caller is let through as the half-open
+        request; it must report back with ``record()`` (or ``release()``).
+        """
+        endpoint = _endpoint(url)
+        if breaker_exempt(endpoint):
+            return
+        record = self._records().get(endpoint)
+        if not record or not record.get("open_until"):
+            return
+        if time.time() >= record["open_until"] and self._start_half_open(endpoint):
+            return
+        raise CircuitOpenError(
+            f"{endpoint} failed {record.get('failures', 0)} times in a row; "
+            "skipped until it answers again"
+        )
+
+    def record(self, url: str, ok: bool) -> None:
+        endpoint = _endpoint(url)
+        if breaker_exempt(endpoint):
+            return
+        with self._lock:
+            self._half_open.pop(endpoint, None)
+            records = self._records()
+            record = records.get(endpoint)
+            if ok:
+                if record is None:
+                    return
+                records.pop(endpoint)
+            else:
+                record = dict(record or {"failures": 0, "opens": 0, "open_until": 0})
+                record["failures"] += 1
+                if record["open_until"]:
+                    # Still open: only a failure after the cool-down (the
+                    # half-open request) re-opens it; requests that were
+                    # already in flight when it opened don't stretch it.
+                    reopen = time.time() >= record["open_until"]
+                else:
+                    reopen = record["failures"] >= BREAKER_FAILURE_THRESHOLD
+                if reopen:
+                    cooldown = min(BREAKER_COOLDOWN_MAX, BREAKER_COOLDOWN * (2 ** record["opens"]))
+                    record["opens"] += 1
+                    record["open_until"] = time.time() + cooldown
+                records[endpoint] = record
+            self.state.put(BREAKER_STATE_KEY, records)
+
+    def release(self, url: str) -> None:
+        """Give up a half-open request without a verdict (e.g. cancelled)."""
+        with self._lock:
+            self._half_open.pop(_endpoint(url), None)
+
+    def _start_half_open(self, endpoint: str) -> bool:
+        with self._lock:
+            started = self._half_open.get(endpoint)
+            now = time.monotonic()
+            if started is not None and now - started < BREAKER_HALF_OPEN_TIMEOUT:
+                return False
+            self._half_open[endpoint] = now
+            return True
+
+
+_CIRCUIT_BREAKERS: Optional[CircuitBreakers] = None
+_CIRCUIT_BREAKERS_LOCK = threading.Lock()
+
+
+def get_circuit_breakers() -> CircuitBreakers:
+    """Process-wide circuit breakers (backed by the shared state file)."""
+    global _CIRCUIT_BREAKERS
+    with _CIRCUIT_BREAKERS_LOCK:
+        if _CIRCUIT_BREAKERS is None:
+            _CIRCUIT_BREAKERS = CircuitBreakers()
+        return _CIRCUIT_BREAKERS
+
+
+_HOST_POLICIES: Dict[str, HostPolicy] = {}
+_HOST_POLICIES_LOCK = threading.Lock()
+
+
+def get_host_policy(url: str) -> HostPolicy:
+    """Process-wide policy for the host `url` points at."""
+    host = urlparse(url).netloc.lower() or url.lower()
+    with _HOST_POLICIES_LOCK:
+        policy = _HOST_POLICIES.get(host)
+        if policy is None:
+            rate, burst, max_concurrency = HOST_RATE_LIMITS.get(host, DEFAULT_HOST_RATE_LIMIT)
+            policy = HostPolicy(host, rate, burst, max_concurrency)
+            _HOST_POLICIES[host] = policy
+        return policy
+
+
+def request_with_retries(
+    session,
+    method: str,
+    url: str,
+    retry_statuses: FrozenSet[int] = RETRY_STATUSES,
+    retry_connection_errors: bool = True,
+    attempts: int = RETRY_ATTEMPTS,
+    **kwargs,
+) -> requests.Response:
+    """``session.request(method, url, **kwargs)`` under the host's policy.
+
+    Returns the last response (callers still ``raise_for_status()``); a
+    connection error on the last attempt is raised, and CircuitOpenError
+    is raised without a request while the endpoint is skipped. Pass
+    ``retry_statuses=RATE_LIMITED_STATUSES, retry_connection_errors=False``
+    for requests that must not be repeated unless the server refused them.
+    """
+    session = session or requests
+    breakers = get_circuit_breakers()
+    breakers.check(url)
+    try:
+        response = _request_with_policy(
+            session, method, url, retry_statuses, retry_connection_errors, attempts, **kwargs
+        )
+    except requests.RequestException:
+        breakers.record(url, ok=False)
+        raise
+    except BaseException:
+        breakers.release(url)
+        raise
+    breakers.record(url, ok=not breaker_counts_status(response.status_code))
+    return response
+
+
+def _request_with_policy(session, method, url, retry_statuses, retry_connection_errors, attempts, **kwargs):
+    policy = get_host_policy(url)
+    for attempt in range(attempts):
+        last_attempt = attempt == attempts - 1
+        wait = policy.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        try:
+            with policy.slot():
+                response = session.request(method, url, **kwargs)
+        except requests.ConnectionError:
+            policy.record(None)
+            if last_attempt or not retry_connection_errors:
+                raise
+            policy.record_retry()
+            time.sleep(retry_delay(attempt))
+            continue
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        policy.record(response.status_code, retry_after)
+        if last_attempt or response.status_code not in retry_statuses:
+            return response
+        if retry_after is not None and retry_after > RETRY_AFTER_MAX:
+            return response
+        policy.record_retry()
+        response.close()
+        time.sleep(retry_delay(attempt, retry_after))
+    return response
@@ -0,0 +1,176 @@
+"""
+Idle-time prefetching for the interactive poster.
+
+While the user reads Steam deals, ``IdlePrefetcher`` warms the sections they
+are likely to open next (Nintendo deals, the news pool, the last collection)
+on one low-priority worker thread. Jobs only start after the foreground has
+been quiet for ``PREFETCH_IDLE_DELAY`` seconds and never while a foreground
+fetch is running (see ``foreground()``), so prefetching doesn't compete with
+the request the user is waiting on. A job that is already running is not
+pre-empted, though: a foreground fetch started meanwhile shares the network
+with that one prefetch until it finishes. Menus ``take()`` a warm result when
+one is there and fetch as before otherwise.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+# Seconds without foreground fetching before a prefetch job may start.
+PREFETCH_IDLE_DELAY = 2.0
+# Runs of a job nobody took a result from before it waits for ``take()``, so
+# an unused section isn't refetched every `max_age` for the whole session.
+PREFETCH_MAX_UNTAKEN_RUNS = 3
+
+
+class IdlePrefetcher:
+    """Keeps one fresh result per registered job, fetched when idle.
+
+    A job re-runs when its result is taken, or when it is older than its
+    `max_age` (a failed job waits `max_age` before trying again) until it
+    has run `max_untaken_runs` times without a ``take()``; it then waits
+    for the next ``take()``. Results are handed out once: ``take()``
+    removes them, so a menu opened twice gets fresh data the second time.
+    """
+
+    def __init__(
+        self,
+        idle_delay: float = PREFETCH_IDLE_DELAY,
+        max_untaken_runs: int = PREFETCH_MAX_UNTAKEN_RUNS,
+    ):
+        self.idle_delay = idle_delay
+        self.max_untaken_runs = max(1, int(max_untaken_runs))
+        self._jobs: Dict[str, Tuple[Callable[[], Any], float]] = {}
+        self._results: Dict[str, Tuple[float, Any]] = {}
+        self._failed: Dict[str, float] = {}
+        # Runs per job since it was added or last taken.
+        self._runs: Dict[str, int] = {}
+        self._running: Optional[str] = None
+        self._foreground = 0
+        self._last_foreground = time.monotonic()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def add(self, key: str, func: Callable[[], Any], max_age: float) -> None:
+        """Register (or replace) job `key`; `func()` runs on the worker thread."""
+        with self._cond:
+            self._jobs[key] = (func, max_age)
+            self._results.pop(key, None)
+            self._failed.pop(key, None)
+            self._runs.pop(key, None)
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._work, name="idle-prefetch", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def discard(self, key: str) -> None:
+        """Drop job `key` and any result it left."""
+        with self._cond:
+            self._jobs.pop(key, None)
+            self._results.pop(key, None)
+            self._failed.pop(key, None)
+            self._runs.pop(key, None)
+
+    def take(self, key: str, wait: bool = True) -> Any:
+        """Return job `key`'s fresh result (None if there is none).
+
+        With `wait`, a job that is running right now is waited for, since
+        it is already further along than a new foreground fetch would be.
+        Either way the job is re-armed for the next visit.
+        """
+        with self._cond:
+            while wait and self._running == key and not self._closed:
+                self._cond.wait()
+            entry = self._results.pop(key, None)
+            self._runs.pop(key, None)
+            job = self._jobs.get(key)
+            self._cond.notify_all()
+        if entry is None or job is None:
+            return None
+        finished_at, value = entry
+        if time.monotonic() - finished_at >= job[1]:
+            return None
+        return value
+
+    @contextmanager
+    def foreground(self) -> Iterator[None]:
+        """Mark a user-facing fetch; no new job starts until it is done."""
+        with self._cond:
+            self._foreground += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._foreground -= 1
+                self._last_foreground = time.monotonic()
+                self._cond.notify_all()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def _due(self) -> Tuple[Optional[str], Optional[float]]:
+        """The next job to run, else how long to sleep (None = until notified)."""
+        if self._foreground:
+            return None, None
+        now = time.monotonic()
+        idle_left = self._last_foreground + self.idle_delay - now
+        if idle_left > 0:
+            return None, idle_left
+        sleep: Optional[float] = None
+        for key, (_func, max_age) in self._jobs.items():
+            if self._runs.get(key, 0) >= self.max_untaken_runs:
+                continue
+            done_at = self._results[key][0] if key in self._results else self._failed.get(key)
+            if done_at is None or now - done_at >= max_age:
+                return key, None
+            left = done_at + max_age - now
+            sleep = left if sleep is None else min(sleep, left)
+        return None, sleep
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return
+                    key, sleep = self._due()
+                    if key is not None:
+                        break
+                    self._cond.wait(timeout=sleep)
+                func = self._jobs[key][0]
+                self._running = key
+                self._runs[key] = self._runs.get(key, 0) + 1
+            try:
+                value = func()
+                failed = False
+            except Exception:
+                value, failed = None, True
+            with self._cond:
+                self._running = None
+                if self._jobs.get(key, (None,))[0] is func:
+                    if failed:
+                        self._results.pop(key, None)
+                        self._failed[key] = time.monotonic()
+                    else:
+                        self._failed.pop(key, None)
+                        self._results[key] = (time.monotonic(), value)
+                self._cond.notify_all()
+
+
+_SHARED_PREFETCHER: Optional[IdlePrefetcher] = None
+_SHARED_PREFETCHER_LOCK = threading.Lock()
+
+
+def get_idle_prefetcher() -> IdlePrefetcher:
+    """Process-wide idle prefetcher."""
+    global _SHARED_PREFETCHER
+    with _SHARED_PREFETCHER_LOCK:
+        if _SHARED_PREFETCHER is None:
+            _SHARED_PREFETCHER = IdlePrefetcher()
+        return _SHARED_PREFETCHER
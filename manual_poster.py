@@ -19,18 +19,24 @@ from steam_deals import (
     TWEET_MAX_LENGTH,
     DEAL_MODE_CONFIGS,
     DEAL_CATEGORY_CONFIGS,
+    SEARCH_PAGE_CACHE_TTL,
+    muted_progress,
 )
 from buffer_client import BufferClient
+from idle_prefetch import get_idle_prefetcher
+from posted_history import DEAL_HISTORY, NEWS_HISTORY, PostedHistory
 from news_feeds import (
     DEFAULT_NEWS_LIMIT,
     NewsImageBlockedError,
-    fetch_news_pool,
     format_news_tweets,
     format_published_age,
+    NEWS_POOL_REFRESH_SECONDS,
+    load_news_pool,
     media_badge,
+    news_key,
+    refresh_news_pool,
     save_news_image,
 )
-import json
 import re
 import time
 import sys
@@ -38,6 +44,7 @@ import os
 import random
 import shutil
 import subprocess
+import threading
 import webbrowser
 from typing import Dict, List, Optional, Tuple
 
@@ -59,6 +66,7 @@ VERSION = "v2.1.8"
 _BUFFER_CLIENT: Optional[BufferClient] = None
 _BUFFER_CHECKED = False
 
+# JSON history of earlier versions; imported once into posted_history.py's store.
 POSTED_HISTORY_FILE = os.path.join(
     os.path.dirname(os.path.abspath(__file__)),
     ".manual_poster_posted.json",
@@ -68,8 +76,12 @@ POSTED_NEWS_HISTORY_FILE = os.path.join(
     ".manual_poster_posted_news.json",
 )
 POSTED_DEPRIORITIZE_DAYS = 14
-POSTED_HISTORY_MAX_ENTRIES = 300
-POSTED_NEWS_HISTORY_MAX_ENTRIES = 200
+# How long idle-prefetched sections stay good enough to show (seconds).
+PREFETCH_DEALS_MAX_AGE = SEARCH_PAGE_CACHE_TTL
+PREFETCH_NINTENDO_MAX_AGE = 600
+PREFETCH_COLLECTION_MAX_AGE = SEARCH_PAGE_CACHE_TTL
+# Idle-prefetch job keys of the collection kept warm (at most one).
+_PREFETCHED_COLLECTIONS: List[str] = []
 
 BANNER = (
     "   ____________________    __  ___ \n"
@@ -509,168 +521,92 @@ def _deal_key(deal: Dict) -> str:
     return deal.get("name", "").strip().lower()
 
 
-def load_posted_history() -> Dict[str, Dict]:
-    if not os.path.exists(POSTED_HISTORY_FILE):
-        return {}
+def _recent_cutoff() -> float:
+    return time.time() - (POSTED_DEPRIORITIZE_DAYS * 86400)
 
-    try:
-        with open(POSTED_HISTORY_FILE, encoding="utf-8") as history_file:
-            data = json.load(history_file)
-    except (OSError, json.JSONDecodeError):
-        return {}
-
-    entries = data.get("entries", {})
-    if isinstance(entries, list):
-        entries = {
-            _deal_key(entry): entry
-            for entry in entries
-            if isinstance(entry, dict)
-        }
-    return entries if isinstance(entries, dict) else {}
 
+def _news_key(item: Dict) -> str:
+    return news_key(item)
 
-def save_posted_history(history: Dict[str, Dict]) -> None:
-    sorted_entries = sorted(
-        history.values(),
-        key=lambda entry: entry.get("posted_at", 0),
-        reverse=True,
-    )[:POSTED_HISTORY_MAX_ENTRIES]
-    trimmed_history = {_deal_key(entry): entry for entry in sorted_entries}
 
-    with open(POSTED_HISTORY_FILE, "w", encoding="utf-8") as history_file:
-        json.dump({"entries": trimmed_history}, history_file, indent=2)
+_POSTED_HISTORY = PostedHistory(
+    legacy_files={
+        DEAL_HISTORY: (POSTED_HISTORY_FILE, _deal_key),
+        NEWS_HISTORY: (POSTED_NEWS_HISTORY_FILE, _news_key),
+    },
+)
 
 
 def mark_deal_posted(deal: Dict) -> None:
-    history = load_posted_history()
-    history[_deal_key(deal)] = {
-        "name": deal.get("name", ""),
-        "steam_url": deal.get("steam_url", ""),
-        "price": deal.get("price", ""),
-        "posted_at": time.time(),
-    }
-    save_posted_history(history)
+    mark_deals_posted([deal])
 
 
 def mark_deals_posted(deals: List[Dict]) -> None:
-    if not deals:
-        return
-
-    history = load_posted_history()
-    posted_at = time.time()
-    for deal in deals:
-        history[_deal_key(deal)] = {
-            "name": deal.get("name", ""),
-            "steam_url": deal.get("steam_url", ""),
-            "price": deal.get("price", ""),
-            "posted_at": posted_at,
-        }
-    save_posted_history(history)
+    _POSTED_HISTORY.add(
+        DEAL_HISTORY,
+        [
+            (
+                _deal_key(deal),
+                {
+                    "name": deal.get("name", ""),
+                    "steam_url": deal.get("steam_url", ""),
+                    "price": deal.get("price", ""),
+                },
+            )
+            for deal in deals
+        ],
+    )
 
 
-def deprioritize_posted_deals(deals: List[Dict]) -> Tuple[List[Dict], int]:
-    history = load_posted_history()
-    if not history:
-        return deals, 0
-
-    cutoff = time.time() - (POSTED_DEPRIORITIZE_DAYS * 86400)
-    fresh_deals = []
-    posted_deals = []
+def _move_posted_to_end(kind: str, items: List[Dict], key_func) -> Tuple[List[Dict], int]:
+    posted_keys = _POSTED_HISTORY.posted_keys(
+        kind, (key_func(item) for item in items), since=_recent_cutoff()
+    )
+    if not posted_keys:
+        return items, 0
 
-    for deal in deals:
-        entry = history.get(_deal_key(deal))
-        if entry and entry.get("posted_at", 0) >= cutoff:
-            posted_deals.append(deal)
+    fresh: List[Dict] = []
+    posted: List[Dict] = []
+    for item in items:
+        if key_func(item) in posted_keys:
+            posted.append(item)
         else:
-            fresh_deals.append(deal)
-
-    if posted_deals:
-        random.shuffle(posted_deals)
-
-    return fresh_deals + posted_deals, len(posted_deals)
-
-
-def is_recently_posted(deal: Dict) -> bool:
-    history = load_posted_history()
-    entry = history.get(_deal_key(deal))
-    if not entry:
-        return False
-
-    cutoff = time.time() - (POSTED_DEPRIORITIZE_DAYS * 86400)
-    return entry.get("posted_at", 0) >= cutoff
-
-
-def _news_key(item: Dict) -> str:
-    url = (item.get("url") or "").strip().rstrip("/").lower()
-    if url:
-        return url
-    return (item.get("title") or "").strip().lower()
-
-
-def load_posted_news_history() -> Dict[str, Dict]:
-    if not os.path.exists(POSTED_NEWS_HISTORY_FILE):
-        return {}
+            fresh.append(item)
 
-    try:
-        with open(POSTED_NEWS_HISTORY_FILE, encoding="utf-8") as history_file:
-            data = json.load(history_file)
-    except (OSError, json.JSONDecodeError):
-        return {}
+    random.shuffle(posted)
+    return fresh + posted, len(posted)
 
-    entries = data.get("entries", {})
-    return entries if isinstance(entries, dict) else {}
 
+def deprioritize_posted_deals(deals: List[Dict]) -> Tuple[List[Dict], int]:
+    return _move_posted_to_end(DEAL_HISTORY, deals, _deal_key)
 
-def save_posted_news_history(history: Dict[str, Dict]) -> None:
-    sorted_entries = sorted(
-        history.values(),
-        key=lambda entry: entry.get("posted_at", 0),
-        reverse=True,
-    )[:POSTED_NEWS_HISTORY_MAX_ENTRIES]
-    trimmed = {_news_key(entry): entry for entry in sorted_entries}
 
-    with open(POSTED_NEWS_HISTORY_FILE, "w", encoding="utf-8") as history_file:
-        json.dump({"entries": trimmed}, history_file, indent=2)
+def is_recently_posted(deal: Dict) -> bool:
+    return _POSTED_HISTORY.is_posted(DEAL_HISTORY, _deal_key(deal), _recent_cutoff())
 
 
 def mark_news_posted(item: Dict) -> None:
-    history = load_posted_news_history()
-    history[_news_key(item)] = {
-        "title": item.get("title", ""),
-        "url": item.get("url", ""),
-        "source": item.get("source", ""),
-        "posted_at": time.time(),
-    }
-    save_posted_news_history(history)
+    _POSTED_HISTORY.add(
+        NEWS_HISTORY,
+        [
+            (
+                _news_key(item),
+                {
+                    "title": item.get("title", ""),
+                    "url": item.get("url", ""),
+                    "source": item.get("source", ""),
+                },
+            )
+        ],
+    )
 
 
 def is_recently_posted_news(item: Dict) -> bool:
-    history = load_posted_news_history()
-    entry = history.get(_news_key(item))
-    if not entry:
-        return False
-    cutoff = time.time() - (POSTED_DEPRIORITIZE_DAYS * 86400)
-    return entry.get("posted_at", 0) >= cutoff
+    return _POSTED_HISTORY.is_posted(NEWS_HISTORY, _news_key(item), _recent_cutoff())
 
 
 def deprioritize_posted_news(items: List[Dict]) -> Tuple[List[Dict], int]:
-    history = load_posted_news_history()
-    if not history:
-        return items, 0
-
-    cutoff = time.time() - (POSTED_DEPRIORITIZE_DAYS * 86400)
-    fresh: List[Dict] = []
-    posted: List[Dict] = []
-    for item in items:
-        entry = history.get(_news_key(item))
-        if entry and entry.get("posted_at", 0) >= cutoff:
-            posted.append(item)
-        else:
-            fresh.append(item)
-
-    if posted:
-        random.shuffle(posted)
-    return fresh + posted, len(posted)
+    return _move_posted_to_end(NEWS_HISTORY, items, _news_key)
 
 
 def print_deal_header(deal_number: int, deal: Dict) -> None:
@@ -1108,7 +1044,7 @@ def show_deal_modes_menu(detector: SteamDealDetector) -> None:
 
         mode_key = mode_keys[mode_index - 1]
         config = DEAL_MODE_CONFIGS[mode_key]
-        deals = detector.get_deal_mode_deals(mode_key)
+        deals = load_collection_deals(detector, "mode", mode_key)
         show_collection_copy_loop(detector, config["label"], deals)
 
 
@@ -1140,7 +1076,7 @@ def show_deal_categories_menu(detector: SteamDealDetector) -> None:
 
         category_key = category_keys[category_index - 1]
         config = DEAL_CATEGORY_CONFIGS[category_key]
-        deals = detector.get_category_deals(category_key)
+        deals = load_collection_deals(detector, "category", category_key)
         show_collection_copy_loop(detector, config["label"], deals)
 
 
@@ -1178,37 +1114,101 @@ def show_news_menu() -> None:
     pool: List[Dict] = []
     fetch_errors: List[str] = []
     offset = 0
+    # Saved headlines show at once; feeds are checked on a background thread
+    # and new headlines are folded in when it finishes.
+    background: Dict = {}
+
+    def use_pool(new_pool: List[Dict]) -> None:
+        nonlocal pool
+        pool, posted_count = deprioritize_posted_news(new_pool)
+        if posted_count:
+            themed_print(
+                f"Moved {posted_count} recently copied headline"
+                f"{'s' if posted_count != 1 else ''} to the end for more variety.",
+                "muted",
+            )
+
+    def start_background_refresh() -> None:
+        def refresh() -> None:
+            try:
+                with get_idle_prefetcher().foreground():
+                    background["result"] = refresh_news_pool()
+            except Exception as exc:  # noqa: BLE001
+                background["error"] = exc
+
+        background.clear()
+        background["thread"] = threading.Thread(target=refresh, name="news-refresh", daemon=True)
+        background["thread"].start()
+
+    def fold_background_refresh(wait: bool = False) -> None:
+        nonlocal fetch_errors, offset
+        thread = background.get("thread")
+        if thread is None:
+            return
+        if wait:
+            thread.join()
+        if thread.is_alive():
+            return
+        background.pop("thread")
+        if "result" not in background:
+            return
+        new_pool, fetch_errors, new_count = background.pop("result")
+        if new_count and new_pool:
+            use_pool(new_pool)
+            if offset >= len(pool):
+                offset = 0
+            themed_print(
+                f"Loaded {new_count} new headline{'s' if new_count != 1 else ''}.",
+                "muted",
+            )
 
     def load_pool(force: bool = False) -> bool:
         nonlocal pool, fetch_errors, offset
         if pool and not force:
             return True
+        if background.get("thread") is not None:
+            # A refresh is already running; use it instead of starting another.
+            fold_background_refresh(wait=True)
+            if pool:
+                offset = 0
+                return True
         themed_print("\nFetching gaming news from RSS feeds...", "muted")
         try:
-            pool, fetch_errors = fetch_news_pool()
+            with get_idle_prefetcher().foreground():
+                new_pool, fetch_errors, _ = refresh_news_pool()
         except Exception as exc:  # noqa: BLE001
             themed_print(f"Could not load news feeds: {exc}", "error")
             themed_input("\nPress Enter to go back...", "muted")
             pool = []
             return False
         offset = 0
-        if not pool:
+        if not new_pool:
+            pool = []
             themed_print("No news items found right now.", "warning")
             themed_input("\nPress Enter to go back...", "muted")
             return False
-        pool, posted_count = deprioritize_posted_news(pool)
-        if posted_count:
-            themed_print(
-                f"Moved {posted_count} recently copied headline"
-                f"{'s' if posted_count != 1 else ''} to the end for more variety.",
-                "muted",
-            )
+        use_pool(new_pool)
         return True
 
-    if not load_pool(force=True):
+    # take() re-arms the "news" job; as a foreground step it also restarts
+    # the idle delay, so the job can't start before the menu's own refresh
+    # (itself foreground work) has begun.
+    with get_idle_prefetcher().foreground():
+        prefetched = get_idle_prefetcher().take("news")
+    saved_pool = None if prefetched and prefetched[0] else load_news_pool()
+    if saved_pool is None:
+        # Feeds were checked moments ago while the Steam deals were open.
+        use_pool(prefetched[0])
+        fetch_errors = prefetched[1]
+    elif saved_pool:
+        themed_print("\nShowing saved headlines; checking feeds in the background...", "muted")
+        use_pool(saved_pool)
+        start_background_refresh()
+    elif not load_pool(force=True):
         return
 
     while True:
+        fold_background_refresh()
         if not pool and not load_pool(force=True):
             return
 
@@ -1412,9 +1412,10 @@ def show_keyword_search_menu(detector: SteamDealDetector) -> None:
 def show_nintendo_deals_menu(detector: SteamDealDetector) -> None:
     def fetch_nintendo_deals(active_keyword: str):
         themed_print("Fetching Nintendo eShop US discounted games...", "muted")
-        return detector.get_nintendo_us_deals(keyword=active_keyword)
+        with get_idle_prefetcher().foreground():
+            return detector.get_nintendo_us_deals(keyword=active_keyword)
 
-    results = fetch_nintendo_deals("")
+    results = get_idle_prefetcher().take("nintendo") or fetch_nintendo_deals("")
     if not results:
         themed_print("No Nintendo discounted games found right now.", "warning")
         return
@@ -1578,21 +1579,163 @@ def preview_theme_colors() -> None:
     themed_print("Command: python manual_poster.py --preview-colors", "muted")
 
 
+def load_collection_deals(detector: SteamDealDetector, kind: str, key: str) -> List[Dict]:
+    """Deals for a deal mode ("mode") or category, prefetched when possible.
+
+    The collection opened last is the likeliest next pick, so a fresh copy
+    of it is prefetched in the background for the next visit.
+    """
+    prefetcher = get_idle_prefetcher()
+    job_key = f"collection:{kind}:{key}"
+    deals = prefetcher.take(job_key)
+    if not deals:
+        with prefetcher.foreground():
+            deals = _fetch_collection_deals(detector, kind, key)
+    prefetch_collection(detector, kind, key)
+    return deals
+
+
+def _fetch_collection_deals(detector: SteamDealDetector, kind: str, key: str) -> List[Dict]:
+    if kind == "mode":
+        return detector.get_deal_mode_deals(key)
+    return detector.get_category_deals(key)
+
+
+def prefetch_collection(detector: SteamDealDetector, kind: str, key: str) -> None:
+    """Keep one collection warm in the idle prefetcher (replacing the last one)."""
+    prefetcher = get_idle_prefetcher()
+    job_key = f"collection:{kind}:{key}"
+    for old_key in [name for name in _PREFETCHED_COLLECTIONS if name != job_key]:
+        prefetcher.discard(old_key)
+        _PREFETCHED_COLLECTIONS.remove(old_key)
+    if job_key not in _PREFETCHED_COLLECTIONS:
+        _PREFETCHED_COLLECTIONS.append(job_key)
+
+    def fetch() -> List[Dict]:
+        with muted_progress():
+            return _fetch_collection_deals(detector, kind, key)
+
+    prefetcher.add(job_key, fetch, max_age=PREFETCH_COLLECTION_MAX_AGE)
+
+
+def start_idle_prefetch(detector: SteamDealDetector) -> None:
+    """Warm the next Steam refresh, the Nintendo pool, the news pool and a
+    collection while the user reads Steam deals (idle time only, in that
+    order; see idle_prefetch.py)."""
+    prefetcher = get_idle_prefetcher()
+
+    def fetch_next_deals() -> List[Dict]:
+        # A fresh random sample (new offsets), enriched like a normal refresh.
+        with muted_progress():
+            return detector.get_all_deals()
+
+    prefetcher.add("next_deals", fetch_next_deals, max_age=PREFETCH_DEALS_MAX_AGE)
+
+    def fetch_nintendo() -> List[Dict]:
+        with muted_progress():
+            return detector.get_nintendo_us_deals()
+
+    prefetcher.add("nintendo", fetch_nintendo, max_age=PREFETCH_NINTENDO_MAX_AGE)
+    prefetcher.add("news", refresh_news_pool, max_age=NEWS_POOL_REFRESH_SECONDS)
+    if not _PREFETCHED_COLLECTIONS:
+        prefetch_collection(detector, "mode", next(iter(DEAL_MODE_CONFIGS)))
+
+
+def start_deal_refresh(detector: SteamDealDetector) -> Dict:
+    """Load the Steam deal pool: the prefetched next batch when there is
+    one (double buffering, so Refresh is instant), else on a worker thread.
+
+    The returned dict gets "preview" (the first parsed search page, details
+    loading on use) as soon as it is ready, then "result" or "error" once
+    the full, enriched pool is done; "ready" is set after each step.
+    """
+    refresh: Dict = {"ready": threading.Event()}
+    prefetched = get_idle_prefetcher().take("next_deals")
+    if prefetched:
+        refresh.update(result=prefetched, done=True)
+        refresh["ready"].set()
+        return refresh
+
+    def on_deals(deals: List[Dict]) -> None:
+        refresh["preview"] = deals
+        refresh["ready"].set()
+
+    def run() -> None:
+        try:
+            # Progress lines would land in the middle of the deal menu, and
+            # idle prefetching waits until the pool is in.
+            with get_idle_prefetcher().foreground(), muted_progress():
+                refresh["result"] = detector.get_all_deals(on_deals=on_deals)
+        except Exception as exc:  # noqa: BLE001
+            refresh["error"] = exc
+        finally:
+            refresh["done"] = True
+            refresh["ready"].set()
+
+    refresh["thread"] = threading.Thread(target=run, name="deal-refresh", daemon=True)
+    refresh["thread"].start()
+    return refresh
+
+
+def first_refreshed_deals(refresh: Dict) -> List[Dict]:
+    """Block until the preview (or the full pool, if it wins) is ready."""
+    refresh["ready"].wait()
+    if "preview" in refresh and not refresh.get("done"):
+        return list(refresh["preview"])
+    if refresh.get("thread") is not None:
+        refresh["thread"].join()
+    if "error" in refresh:
+        raise refresh["error"]
+    return refresh["result"]
+
+
+def fold_deal_refresh(refresh: Dict, deals: List[Dict], shown: int, wait: bool = False) -> Tuple[List[Dict], int]:
+    """Swap the unseen preview deals for the full pool once it has loaded.
+
+    The first `shown` deals stay put; the pool follows without them, with
+    recently posted games moved to the end. Returns the (possibly same)
+    list and how many deals were added.
+    """
+    thread = refresh.get("thread")
+    if thread is None:
+        return deals, 0
+    if wait:
+        thread.join()
+    if thread.is_alive():
+        return deals, 0
+    refresh.pop("thread")
+    if "error" in refresh:
+        themed_print(f"Could not load the rest of the deals: {refresh['error']}", "warning")
+        return deals, 0
+
+    kept = deals[:shown]
+    kept_keys = {_deal_key(deal) for deal in kept}
+    rest, _posted_count = deprioritize_posted_deals(
+        [deal for deal in refresh["result"] if _deal_key(deal) not in kept_keys]
+    )
+    return kept + rest, len(kept) + len(rest) - len(deals)
+
+
 def main():
     print_banner()
 
     detector = SteamDealDetector()
+    start_idle_prefetch(detector)
     
     while True:
         themed_print("Fetching latest Steam deals...", "muted")
-        deals = detector.get_all_deals()
+        refresh = start_deal_refresh(detector)
+        deals = first_refreshed_deals(refresh)
         deals, posted_count = deprioritize_posted_deals(deals)
         
         if not deals:
             themed_print("No deals found. Try again later.", "warning")
             continue
         
-        themed_print(f"Found {len(deals)} deals!", "success")
+        if refresh.get("done"):
+            themed_print(f"Found {len(deals)} deals!", "success")
+        else:
+            themed_print(f"Found {len(deals)} deals, loading more in the background...", "success")
         if posted_count:
             themed_print(
                 f"Moved {posted_count} recently copied game"
@@ -1603,11 +1746,21 @@ def main():
         print_separator(50)
         
         deal_index = 0
+        shown = 0
         refresh_requested = False
 
-        while deal_index < len(deals):
+        while True:
+            # Wait for the pool only once the preview has run out.
+            deals, added = fold_deal_refresh(
+                refresh, deals, shown, wait=deal_index >= len(deals)
+            )
+            if added > 0:
+                themed_print(f"Loaded {added} more deals.", "muted")
+            if deal_index >= len(deals):
+                break
             deal = deals[deal_index]
             deal_number = deal_index + 1
+            shown = max(shown, deal_number)
 
             print_deal_header(deal_number, deal)
             
@@ -1731,3 +1884,6 @@ if __name__ == "__main__":
         except Exception as e:
             themed_print(f"\nError: {e}", "error")
             themed_print("Please check your internet connection and try again.", "warning")
+        finally:
+            # No new background jobs while the interpreter shuts down.
+            get_idle_prefetcher().close()
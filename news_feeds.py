@@ -9,8 +9,13 @@ from __future__ import annotations
 
 import html
 import hashlib
+import json
 import os
 import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from pathlib import Path
@@ -19,18 +24,34 @@ from typing import Dict, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
 import feedparser
-import requests
 
+from http_client import HTTPClient, get_http_client
 from steam_deals import TWEET_MAX_LENGTH
 
 USER_AGENT = "SteamDealBot/2.1.8 (+news reader; https://github.com/rfnco/steamdealbot)"
 REQUEST_TIMEOUT = 20
+# A feed revalidated this recently is reused without any request; older ones
+# are revalidated with ETag / Last-Modified (unchanged feeds aren't re-parsed).
+NEWS_FEED_FRESH_SECONDS = 120
+# Feeds are fetched in parallel; each request gets NEWS_FEED_TIMEOUT and the
+# whole pool NEWS_POOL_DEADLINE, after which late feeds are reported in errors.
+NEWS_FETCH_WORKERS = 8
+NEWS_FEED_TIMEOUT = 10
+NEWS_POOL_DEADLINE = 15.0
 DEFAULT_NEWS_LIMIT = 10
 # Fetch a larger merged pool so Refresh can rotate to the next page.
 NEWS_POOL_LIMIT = 80
 # X counts each http(s) URL as this many characters regardless of real length.
 TWITTER_URL_LENGTH = 23
 NEWS_IMAGES_DIR = Path(__file__).resolve().parent / "images" / "news"
+# Normalized headlines kept between runs, so the news menu opens instantly.
+NEWS_POOL_FILE = Path(__file__).resolve().parent / ".news_pool.json"
+# Serializes load-merge-save of the stored pool between refreshing threads.
+_NEWS_POOL_LOCK = threading.Lock()
+NEWS_POOL_STORE_LIMIT = 300
+NEWS_POOL_MAX_AGE_DAYS = 7
+# fetch_news pages through the stored pool while it is younger than this.
+NEWS_POOL_REFRESH_SECONDS = 300
 
 # Gaming-focused RSS/Atom sources (fetched with a browser-like User-Agent).
 DEFAULT_FEEDS: List[Dict[str, str]] = [
@@ -288,15 +309,8 @@ def media_badge(item: Dict) -> str:
     return "[" + "+".join(parts) + "]"
 
 
-def fetch_feed(feed: Dict[str, str], session: Optional[requests.Session] = None) -> List[Dict]:
-    sess = session or requests.Session()
-    response = sess.get(
-        feed["url"],
-        headers={"User-Agent": USER_AGENT},
-        timeout=REQUEST_TIMEOUT,
-    )
-    response.raise_for_status()
-    parsed = feedparser.parse(response.content)
+def _parse_feed_items(feed: Dict[str, str], content: bytes) -> List[Dict]:
+    parsed = feedparser.parse(content)
     items: List[Dict] = []
     for entry in parsed.entries:
         item = normalize_entry(entry, feed["name"], feed["id"])
@@ -305,6 +319,22 @@ def fetch_feed(feed: Dict[str, str], session: Optional[requests.Session] = None)
     return items
 
 
+def fetch_feed(
+    feed: Dict[str, str],
+    client: Optional[HTTPClient] = None,
+    timeout: float = REQUEST_TIMEOUT,
+) -> List[Dict]:
+    items = (client or get_http_client()).fetch_conditional(
+        feed["url"],
+        parse=lambda content: _parse_feed_items(feed, content),
+        fresh_for=NEWS_FEED_FRESH_SECONDS,
+        headers={"User-Agent": USER_AGENT},
+        timeout=timeout,
+    )
+    # Parsed items are shared with later loads of an unchanged feed.
+    return [dict(item) for item in items]
+
+
 def _owned_feed_is_fresh(item: Dict, now: Optional[datetime] = None) -> bool:
     """Owned-blog posts only appear when newer than OWNED_FEED_MAX_AGE_DAYS."""
     published = item.get("published")
@@ -346,26 +376,52 @@ def _filter_and_prioritize_owned_feeds(items: List[Dict]) -> List[Dict]:
     return pin + rest
 
 
-def fetch_news_pool(
-    feeds: Optional[Sequence[Dict[str, str]]] = None,
-    pool_limit: int = NEWS_POOL_LIMIT,
+def news_key(item: Dict) -> str:
+    """Identity of a headline across loads: its URL, else its title."""
+    url = (item.get("url") or "").strip().rstrip("/").lower()
+    if url:
+        return url
+    return (item.get("title") or "").strip().lower()
+
+
+def _fetch_feed_items(
+    feeds: Sequence[Dict[str, str]],
+    deadline: Optional[float],
 ) -> Tuple[List[Dict], List[str]]:
-    """Fetch a larger newest-first pool for paging. Returns (items, errors)."""
-    selected = list(feeds or DEFAULT_FEEDS)
-    session = requests.Session()
+    """Fetch `feeds` concurrently; returns (items in feed order, errors)."""
+    selected = list(feeds)
+    client = get_http_client()
     merged: List[Dict] = []
     errors: List[str] = []
 
-    for feed in selected:
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(NEWS_FETCH_WORKERS, len(selected))),
+        thread_name_prefix="news-feed",
+    )
+    futures = [
+        executor.submit(fetch_feed, feed, client, NEWS_FEED_TIMEOUT) for feed in selected
+    ]
+    done, _ = wait(futures, timeout=deadline)
+    # Don't wait for stragglers; their requests finish (or time out) on their own.
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    # Merge in feed order so the result doesn't depend on which feed was fastest.
+    for feed, future in zip(selected, futures):
+        if future not in done:
+            errors.append(f"{feed['name']}: no response within {deadline:g}s")
+            continue
         try:
-            merged.extend(fetch_feed(feed, session=session))
+            merged.extend(future.result())
         except Exception as exc:  # noqa: BLE001
             errors.append(f"{feed['name']}: {exc}")
+    return merged, errors
+
 
+def _dedupe_newest_first(items: Sequence[Dict]) -> List[Dict]:
     seen = set()
     unique: List[Dict] = []
-    for item in merged:
-        key = item["url"].rstrip("/").lower() or item["title"].lower()
+    for item in items:
+        key = news_key(item)
         if key in seen:
             continue
         seen.add(key)
@@ -375,8 +431,124 @@ def fetch_news_pool(
         key=lambda item: item["published"] or datetime.min.replace(tzinfo=timezone.utc),
         reverse=True,
     )
-    unique = _filter_and_prioritize_owned_feeds(unique)
-    return unique[: max(1, pool_limit)], errors
+    return unique
+
+
+def _build_pool(items: Sequence[Dict], pool_limit: int) -> List[Dict]:
+    unique = _filter_and_prioritize_owned_feeds(_dedupe_newest_first(items))
+    return unique[: max(1, pool_limit)]
+
+
+def fetch_news_pool(
+    feeds: Optional[Sequence[Dict[str, str]]] = None,
+    pool_limit: int = NEWS_POOL_LIMIT,
+    deadline: Optional[float] = NEWS_POOL_DEADLINE,
+) -> Tuple[List[Dict], List[str]]:
+    """Fetch a larger newest-first pool for paging. Returns (items, errors).
+
+    Feeds are fetched concurrently. Feeds still loading after `deadline`
+    seconds (None = wait for all) are left out and listed in errors.
+    """
+    merged, errors = _fetch_feed_items(feeds or DEFAULT_FEEDS, deadline)
+    return _build_pool(merged, pool_limit), errors
+
+
+def _item_to_json(item: Dict) -> Dict:
+    data = {key: value for key, value in item.items() if not key.startswith("_")}
+    published = data.get("published")
+    data["published"] = published.isoformat() if published else None
+    return data
+
+
+def _item_from_json(data: Dict) -> Optional[Dict]:
+    if not isinstance(data, dict) or not data.get("title"):
+        return None
+    item = dict(data)
+    try:
+        item["published"] = (
+            datetime.fromisoformat(item["published"]) if item.get("published") else None
+        )
+    except (TypeError, ValueError):
+        item["published"] = None
+    return item
+
+
+def _load_stored_news() -> Tuple[List[Dict], float]:
+    """Stored (default-feed) headlines and when they were last refreshed."""
+    try:
+        with open(NEWS_POOL_FILE, encoding="utf-8") as pool_file:
+            data = json.load(pool_file)
+    except (OSError, ValueError):
+        return [], 0.0
+    if not isinstance(data, dict):
+        return [], 0.0
+    items = [item for item in map(_item_from_json, data.get("items") or []) if item]
+    return items, float(data.get("refreshed_at") or 0)
+
+
+def _save_stored_news(items: Sequence[Dict]) -> None:
+    cutoff = datetime.now(timezone.utc).timestamp() - NEWS_POOL_MAX_AGE_DAYS * 86400
+    kept = [
+        item
+        for item in _dedupe_newest_first(items)
+        if not item.get("published") or _utc_timestamp(item["published"]) >= cutoff
+    ][:NEWS_POOL_STORE_LIMIT]
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=NEWS_POOL_FILE.parent,
+            prefix=f"{NEWS_POOL_FILE.name}.", suffix=".tmp", delete=False,
+        ) as pool_file:
+            tmp_path = pool_file.name
+            json.dump(
+                {"refreshed_at": time.time(), "items": [_item_to_json(item) for item in kept]},
+                pool_file,
+            )
+        os.replace(tmp_path, NEWS_POOL_FILE)
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def _utc_timestamp(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def load_news_pool(
+    pool_limit: int = NEWS_POOL_LIMIT,
+    max_age: Optional[float] = None,
+) -> List[Dict]:
+    """The stored pool from the last refresh ([] if none, or older than `max_age` s)."""
+    items, refreshed_at = _load_stored_news()
+    if not items or (max_age is not None and time.time() - refreshed_at >= max_age):
+        return []
+    return _build_pool(items, pool_limit)
+
+
+def refresh_news_pool(
+    pool_limit: int = NEWS_POOL_LIMIT,
+    deadline: Optional[float] = NEWS_POOL_DEADLINE,
+) -> Tuple[List[Dict], List[str], int]:
+    """Fetch the default feeds and fold new headlines into the stored pool.
+
+    Headlines already stored (by ``news_key``) are kept as they are; only new
+    ones are added. Returns (pool, errors, number of new headlines).
+    """
+    fetched, errors = _fetch_feed_items(DEFAULT_FEEDS, deadline)
+    # Merged against the file as it is now, so concurrent refreshes add up.
+    with _NEWS_POOL_LOCK:
+        stored, _ = _load_stored_news()
+        known = {news_key(item) for item in stored}
+        fresh = [item for item in _dedupe_newest_first(fetched) if news_key(item) not in known]
+        merged = stored + fresh
+        if fetched or not stored:
+            _save_stored_news(merged)
+    return _build_pool(merged, pool_limit), errors, len(fresh)
 
 
 def fetch_news(
@@ -388,7 +560,14 @@ def fetch_news(
 
     Use ``offset`` to page through results (Refresh in the manual poster).
     """
-    pool, errors = fetch_news_pool(feeds=feeds, pool_limit=max(NEWS_POOL_LIMIT, offset + limit))
+    pool_limit = max(NEWS_POOL_LIMIT, offset + limit)
+    if feeds:
+        pool, errors = fetch_news_pool(feeds=feeds, pool_limit=pool_limit)
+    else:
+        # Paging reuses the stored pool instead of refetching every feed.
+        pool, errors = load_news_pool(pool_limit, max_age=NEWS_POOL_REFRESH_SECONDS), []
+        if not pool:
+            pool, errors, _ = refresh_news_pool(pool_limit)
     page_size = max(1, limit)
     start = max(0, offset)
     if start >= len(pool) and pool:
@@ -591,7 +770,7 @@ def save_news_image(item: Dict, destination_dir: Optional[Path] = None) -> Optio
         "Accept-Language": "en-US,en;q=0.9",
     }
 
-    response = requests.get(
+    response = get_http_client().get(
         image_url,
         headers=headers,
         timeout=REQUEST_TIMEOUT,
@@ -0,0 +1,216 @@
+"""
+Posted history for the manual poster (copied deals and news headlines).
+
+Every copy appends rows to a small SQLite file next to the scripts (WAL
+mode, indexed by key and ``posted_at``), so the history is unlimited and
+marking a deal never rewrites the file. Whole pools are checked in one call
+(``posted_keys``), and the keys posted inside the deprioritize window are
+kept in memory for per-row "Posted" labels, reloaded only when the database
+changed (``PRAGMA data_version`` catches other processes' writes).
+
+History from the JSON files written by earlier versions is imported once;
+the JSON files are left in place as a backup.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+POSTED_HISTORY_DB_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    ".manual_poster_posted.sqlite3",
+)
+DEAL_HISTORY = "deal"
+NEWS_HISTORY = "news"
+# Keys per `IN (...)` query; stays under SQLite's bound-parameter limit.
+_QUERY_CHUNK_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posted (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    posted_at REAL NOT NULL,
+    data TEXT
+);
+CREATE INDEX IF NOT EXISTS posted_kind_key ON posted (kind, key, posted_at);
+CREATE INDEX IF NOT EXISTS posted_kind_time ON posted (kind, posted_at);
+CREATE TABLE IF NOT EXISTS migrations (
+    name TEXT PRIMARY KEY,
+    migrated_at REAL NOT NULL
+);
+"""
+
+# kind -> (legacy JSON path, key function for list-style entries)
+LegacyFiles = Dict[str, Tuple[str, Callable[[Dict], str]]]
+
+
+def _read_legacy_entries(path: str, key_func: Callable[[Dict], str]) -> Dict[str, Dict]:
+    try:
+        with open(path, encoding="utf-8") as history_file:
+            data = json.load(history_file)
+    except (OSError, ValueError):
+        return {}
+    entries = data.get("entries", {}) if isinstance(data, dict) else {}
+    if isinstance(entries, list):
+        entries = {key_func(entry): entry for entry in entries if isinstance(entry, dict)}
+    if not isinstance(entries, dict):
+        return {}
+    return {key: entry for key, entry in entries.items() if isinstance(entry, dict)}
+
+
+class PostedHistory:
+    """Append-only SQLite log of posted keys per kind ("deal", "news").
+
+    Safe to share between threads. Any SQLite error disables the store for
+    the process instead of raising; nothing then counts as posted.
+    """
+
+    def __init__(self, path: str = POSTED_HISTORY_DB_FILE, legacy_files: Optional[LegacyFiles] = None):
+        self.path = path
+        self.legacy_files = dict(legacy_files or {})
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self._data_version: Optional[int] = None
+        # kind -> (since, {key: latest posted_at >= since})
+        self._recent: Dict[str, Tuple[float, Dict[str, float]]] = {}
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None or self._disabled:
+            return self._conn
+        try:
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            conn.commit()
+            self._migrate_legacy(conn)
+        except sqlite3.Error as exc:
+            print(f"Posted history unavailable ({exc}); posted games won't be tracked.")
+            self._disabled = True
+            return None
+        self._conn = conn
+        return conn
+
+    def _migrate_legacy(self, conn: sqlite3.Connection) -> None:
+        for kind, (path, key_func) in self.legacy_files.items():
+            name = f"{kind}:{os.path.basename(path)}"
+            if not os.path.exists(path):
+                continue
+            if conn.execute("SELECT 1 FROM migrations WHERE name = ?", (name,)).fetchone():
+                continue
+            entries = _read_legacy_entries(path, key_func)
+            with conn:
+                conn.executemany(
+                    "INSERT INTO posted (kind, key, posted_at, data) VALUES (?, ?, ?, ?)",
+                    [
+                        (kind, key, float(entry.get("posted_at") or 0), json.dumps(entry))
+                        for key, entry in entries.items()
+                    ],
+                )
+                conn.execute(
+                    "INSERT INTO migrations (name, migrated_at) VALUES (?, ?)", (name, time.time())
+                )
+
+    def _check_data_version(self, conn: sqlite3.Connection) -> None:
+        """Drop the in-memory recent keys when another connection committed."""
+        (version,) = conn.execute("PRAGMA data_version").fetchone()
+        if version != self._data_version:
+            self._data_version = version
+            self._recent.clear()
+
+    def add(self, kind: str, entries: Iterable[Tuple[str, Dict]], posted_at: Optional[float] = None) -> None:
+        """Append one row per ``(key, details)``, all stamped `posted_at` (default now)."""
+        posted_at = time.time() if posted_at is None else posted_at
+        rows = [(kind, key, posted_at, json.dumps(details)) for key, details in entries]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO posted (kind, key, posted_at, data) VALUES (?, ?, ?, ?)", rows
+                    )
+            except sqlite3.Error:
+                return
+            recent = self._recent.get(kind)
+            if recent is not None:
+                for _kind, key, stamp, _data in rows:
+                    recent[1][key] = max(stamp, recent[1].get(key, 0))
+
+    def posted_since(self, kind: str, since: float) -> Dict[str, float]:
+        """Every key of `kind` posted at or after `since`, with its latest time."""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return {}
+            try:
+                return self._query_posted_since(conn, kind, since)
+            except sqlite3.Error:
+                return {}
+
+    @staticmethod
+    def _query_posted_since(conn: sqlite3.Connection, kind: str, since: float) -> Dict[str, float]:
+        rows = conn.execute(
+            "SELECT key, MAX(posted_at) FROM posted WHERE kind = ? AND posted_at >= ? GROUP BY key",
+            (kind, since),
+        )
+        return dict(rows.fetchall())
+
+    def posted_keys(self, kind: str, keys: Iterable[str], since: float = 0) -> Set[str]:
+        """The subset of `keys` posted at or after `since`."""
+        keys = list(dict.fromkeys(keys))
+        found: Set[str] = set()
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return found
+            try:
+                for start in range(0, len(keys), _QUERY_CHUNK_SIZE):
+                    chunk = keys[start:start + _QUERY_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    found.update(
+                        key for (key,) in conn.execute(
+                            f"SELECT DISTINCT key FROM posted WHERE kind = ? AND posted_at >= ?"
+                            f" AND key IN ({placeholders})",
+                            (kind, since, *chunk),
+                        )
+                    )
+            except sqlite3.Error:
+                return set()
+        return found
+
+    def is_posted(self, kind: str, key: str, since: float) -> bool:
+        """Membership check for one key, answered from memory.
+
+        The keys posted since `since` are loaded once and reused until the
+        database changes or an earlier `since` is asked for.
+        """
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return False
+            try:
+                self._check_data_version(conn)
+                recent = self._recent.get(kind)
+                if recent is None or since < recent[0]:
+                    recent = (since, self._query_posted_since(conn, kind, since))
+                    self._recent[kind] = recent
+            except sqlite3.Error:
+                return False
+        return recent[1].get(key, 0) >= since
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = None
+            self._recent.clear()
@@ -0,0 +1,103 @@
+"""
+Small persisted state shared by the detectors, with a TTL per read.
+
+Values that are slow to fetch but cheap to keep (Steam's featured specials
+and their expiration stamps, the active sale name, the total specials count)
+are stored in one JSON file next to the scripts, so new processes and every
+web-interface request start warm instead of refetching them.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+STATE_CACHE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    ".steamdealbot_state.json",
+)
+
+_MISSING = object()
+
+
+class StateCache:
+    """JSON-file key/value store; each entry remembers when it was saved.
+
+    Reads pick up changes other processes made (the file is re-read when its
+    mtime changes) and writes replace the file atomically. I/O errors are
+    swallowed: the cache then simply behaves as empty.
+    """
+
+    def __init__(self, path: str = STATE_CACHE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._mtime: Optional[float] = None
+
+    def _refresh(self) -> None:
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as state_file:
+                data = json.load(state_file)
+        except (OSError, ValueError):
+            return
+        entries = data.get("entries") if isinstance(data, dict) else None
+        self._entries = entries if isinstance(entries, dict) else {}
+        self._mtime = mtime
+
+    def _save(self) -> None:
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as state_file:
+                json.dump({"entries": self._entries}, state_file, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+            self._mtime = os.path.getmtime(self.path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def get(self, key: str, ttl: float, default: Any = None) -> Any:
+        """Return the value saved under `key` if it is younger than `ttl` seconds."""
+        with self._lock:
+            self._refresh()
+            entry = self._entries.get(key)
+        if not isinstance(entry, dict) or "value" not in entry:
+            return default
+        if time.time() - float(entry.get("saved_at") or 0) >= ttl:
+            return default
+        return entry["value"]
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._refresh()
+            self._entries[key] = {"saved_at": time.time(), "value": value}
+            self._save()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._refresh()
+            if self._entries.pop(key, _MISSING) is not _MISSING:
+                self._save()
+
+
+_SHARED_STATE: Optional[StateCache] = None
+_SHARED_STATE_LOCK = threading.Lock()
+
+
+def get_state_cache() -> StateCache:
+    """Process-wide state cache instance."""
+    global _SHARED_STATE
+    with _SHARED_STATE_LOCK:
+        if _SHARED_STATE is None:
+            _SHARED_STATE = StateCache()
+        return _SHARED_STATE
@@ -1,5 +1,7 @@
-import requests
+import asyncio
+import contextvars
 import json
+import html
 import time
 import random
 from datetime import datetime, timedelta
@@ -8,6 +10,26 @@ import re
 import urllib.parse
 import os
 import itertools
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import Future
+
+from app_info_cache import get_app_info_cache
+from async_http import AsyncHTTPEngine
+from deal_record import Deal, parse_discount_percent, parse_price_cents, steam_app_id_from_url
+from http_client import get_http_client
+from state_cache import get_state_cache
+from steam_tags import parse_tag_ids, tag_names, unknown_tag_ids
+
+try:
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+    _HAS_LXML = True
+except Exception:
+    lxml_etree = None  # type: ignore
+    lxml_html = None  # type: ignore
+    _HAS_LXML = False
 
 try:
     from nintendeals import noa as nintendo_noa  # type: ignore[import-not-found]
@@ -19,26 +41,74 @@ except Exception:
     _HAS_NINTENDO_DEALS_LIB = False
 
 TWEET_MAX_LENGTH = 280
+STEAM_STORE_HOME_URL = "https://store.steampowered.com/"
+STEAM_FEATURED_CATEGORIES_URL = "https://store.steampowered.com/api/featuredcategories/"
+STEAM_HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
+}
+# Bypass Steam's age-check interstitial so store pages return full
+# content (descriptions and user tags) instead of the age gate.
+STEAM_HTTP_COOKIES = {
+    'birthtime': '568022401',
+    'mature_content': '1',
+    'wants_mature_content': '1',
+}
 STEAMDEALBOT_COLOR_ENABLED = os.environ.get("STEAMDEALBOT_NO_COLOR") != "1"
 MUTED_COLOR = "\033[90m"
 RESET_COLOR = "\033[0m"
 
 
+# Set by muted_progress(); engine tasks inherit it from the caller's context.
+_PROGRESS_MUTED = contextvars.ContextVar("steamdealbot_progress_muted", default=False)
+
+
 def print_progress(message):
+    if _PROGRESS_MUTED.get():
+        return
     if STEAMDEALBOT_COLOR_ENABLED:
         print(f"{MUTED_COLOR}{message}{RESET_COLOR}")
     else:
         print(message)
 
+
+@contextmanager
+def muted_progress():
+    """Silence print_progress for work started inside the block (e.g. a
+    refresh running behind an interactive menu)."""
+    token = _PROGRESS_MUTED.set(True)
+    try:
+        yield
+    finally:
+        _PROGRESS_MUTED.reset(token)
+
 # Steam's "infinite scroll" search results endpoint returns clean JSON and
 # supports pagination, which lets us sample a different slice of specials on
 # every refresh (thousands of deals are available, not just the curated ~10).
 STEAM_SEARCH_RESULTS_URL = "https://store.steampowered.com/search/results/"
+# Batched JSON metadata (short description + weighted tag IDs for many apps per
+# request). appdetails only batches price_overview, so it can't be used here.
+STEAM_STORE_ITEMS_URL = "https://api.steampowered.com/IStoreBrowseService/GetItems/v1/"
+STEAM_TAG_LIST_URL = "https://api.steampowered.com/IStoreService/GetTagList/v1/"
+# App IDs per GetItems request (keeps the query string well under URL limits).
+APP_METADATA_BATCH_SIZE = 50
+# How many of each app's top-weighted user tags to ask for.
+APP_METADATA_TAG_COUNT = 10
 NINTENDO_US_SALES_URL = "https://ec.nintendo.com/api/US/en/search/sales"
 STEAM_DEAL_COUNT = 35
 NINTENDO_DEAL_COUNT = 10
 # How many descriptions to enrich per refresh (each one is an extra page load).
 DESCRIPTION_ENRICH_LIMIT = 12
+# Seconds to wait for enrichment before the rest fall back to generated text.
+DESCRIPTION_ENRICH_DEADLINE = 8.0
+# Wall-clock budget (seconds) for one get_all_deals refresh; None = no limit.
+ALL_DEALS_DEADLINE = 25.0
+# A fallback source with at least this many deals wins the race (the others
+# are no longer waited for).
+FALLBACK_ENOUGH_DEALS = 10
+STEAM_SPECIALS_PAGE_URL = "https://store.steampowered.com/specials/"
+STEAM_SEARCH_PAGE_URL = "https://store.steampowered.com/search/"
 # Keep most manual-poster results near Steam's high-signal pages so the feed
 # includes recognizable games and well-reviewed/viral indies, not only deep
 # catalog items with little public traction.
@@ -50,6 +120,31 @@ POPULAR_SEARCH_PAGES = [
     ("", 50),
 ]
 DISCOVERY_SEARCH_SORTS = ["Reviews_DESC", "", "Released_DESC"]
+# Search pages a mode needs are fetched concurrently (bounded by the shared
+# HTTP engine) so a refresh costs about the slowest single page.
+SEARCH_PAGE_TIMEOUT = 15
+# Search pages are shared across modes, categories and refreshes for a few
+# minutes, so browsing every collection doesn't download a page twice.
+SEARCH_PAGE_CACHE_TTL = 600
+SEARCH_PAGE_CACHE_MAX_ENTRIES = 128
+# featuredcategories specials (and their discount_expiration stamps) are kept
+# this long, in-process and in the state file, before being downloaded again.
+FEATURED_CATEGORIES_TTL = 900
+FEATURED_SPECIALS_STATE_KEY = "featured_specials_us"
+# The active sale name (None when there is no sale) and the total specials
+# count change slowly, so new processes and web requests reuse them from the
+# state file instead of fetching the homepage / a count page again.
+ACTIVE_SALE_NAME_TTL = 3600
+# The sale name only labels deals, so search pages never wait on it longer
+# than this; a slower homepage lookup finishes (and is cached) in the background.
+SALE_NAME_TIMEOUT = 3
+ACTIVE_SALE_NAME_STATE_KEY = "active_sale_name"
+TOTAL_SPECIALS_COUNT_TTL = 1800
+TOTAL_SPECIALS_COUNT_STATE_KEY = "total_specials_count_us"
+# Fields kept from each featured 'specials' item.
+_FEATURED_ITEM_FIELDS = (
+    'id', 'name', 'discount_percent', 'final_price', 'original_price', 'discount_expiration',
+)
 DISCOVERY_OFFSET_LIMIT = 1000
 COLLECTION_DEAL_COUNT = 25
 DEAL_MODE_CONFIGS = {
@@ -144,87 +239,430 @@ GENERIC_TAGS = {
 # Sentinel so we can cache "no sale detected" distinctly from "not fetched yet".
 _UNSET = object()
 
+# Search-row parsing runs for every Steam page, so its patterns are compiled once.
+_DISCOUNT_TEXT_RE = re.compile(r'(-\d+%)')
+_USD_PRICE_RE = re.compile(r'(\$\d[\d,]*\.?\d*)')
+_SPACES_RE = re.compile(r'\s+')
+_NAME_DATE_SUFFIX_RE = re.compile(r'\s*\d{1,2}\s+\w{3,9},?\s+\d{4}.*$')
+_NAME_DISCOUNT_SUFFIX_RE = re.compile(r'\s*-\d+%.*$')
+_NAME_RUPIAH_SUFFIX_RE = re.compile(r'\s*Rp\s*\d+.*$')
+# Element class -> tag for the nodes we read inside a.search_result_row.
+_SEARCH_ROW_FIELDS = {
+    'title': 'span',
+    'search_review_summary': 'span',
+    'discount_pct': 'div',
+    'discount_final_price': 'div',
+    'discount_original_price': 'div',
+}
+# Fields read from an attribute instead of the element text.
+_SEARCH_ROW_ATTR_FIELDS = {'search_review_summary': 'data-tooltip-html'}
+# "Very Positive<br>92% of the 12,345 user reviews for this game are positive."
+_REVIEW_TOOLTIP_RE = re.compile(
+    r'^\s*([^<]+?)\s*<br\s*/?>\s*(\d+)% of the ([\d,]+) user reviews?', re.IGNORECASE
+)
+# data-ds-itemkey prefixes ("App_1145360", "Sub_54029", "Bundle_232").
+_ITEM_TYPES = {'app': 'app', 'sub': 'sub', 'bundle': 'bundle'}
+if _HAS_LXML:
+    _SEARCH_ROW_XPATH = lxml_etree.XPath(
+        './/a[contains(concat(" ", normalize-space(@class), " "), " search_result_row ")]'
+    )
+
+
+def _search_rows_lxml(results_html):
+    """Yield (row attributes, {field class: text}) for each search row.
+
+    Walks only the a.search_result_row elements and reads every field in a
+    single pass over each row's span/div nodes.
+    """
+    if not results_html or not results_html.strip():
+        return
+    root = lxml_html.fragment_fromstring(results_html, create_parent='div')
+    for row in _SEARCH_ROW_XPATH(root):
+        fields = {}
+        for elem in row.iter('span', 'div'):
+            classes = elem.get('class')
+            if not classes:
+                continue
+            for name in classes.split():
+                if _SEARCH_ROW_FIELDS.get(name) == elem.tag and name not in fields:
+                    attr = _SEARCH_ROW_ATTR_FIELDS.get(name)
+                    fields[name] = elem.get(attr) if attr else elem.text_content()
+        yield row.attrib, fields
+
+
+def _parse_review_tooltip(tooltip):
+    """Return (summary, percent, count) from a search row's review tooltip."""
+    match = _REVIEW_TOOLTIP_RE.search(html.unescape(tooltip or ''))
+    if not match:
+        return None, None, None
+    return match.group(1), int(match.group(2)), int(match.group(3).replace(',', ''))
+
+
+def _search_row_item_type(attrs):
+    """'app', 'sub' or 'bundle' for a search row (None if it can't tell)."""
+    prefix = (attrs.get('data-ds-itemkey') or '').split('_', 1)[0].lower()
+    if prefix in _ITEM_TYPES:
+        return _ITEM_TYPES[prefix]
+    if attrs.get('data-ds-bundleid'):
+        return 'bundle'
+    if attrs.get('data-ds-packageid'):
+        return 'sub'
+    if attrs.get('data-ds-appid'):
+        return 'app'
+    return None
+
+
+def _search_rows_soup(results_html):
+    """BeautifulSoup equivalent of _search_rows_lxml (used without lxml)."""
+    soup = BeautifulSoup(results_html, 'html.parser')
+    for row in soup.select('a.search_result_row'):
+        fields = {}
+        for name, tag in _SEARCH_ROW_FIELDS.items():
+            elem = row.select_one(f'{tag}.{name}')
+            if elem:
+                attr = _SEARCH_ROW_ATTR_FIELDS.get(name)
+                fields[name] = elem.get(attr) if attr else elem.get_text()
+        yield row.attrs, fields
+
+
+class _SearchPageCache:
+    """Small in-process TTL/LRU cache for search-results JSON pages.
+
+    Concurrent requests for the same key are coalesced: the first caller
+    fetches, the others wait for its result (callers may be on different
+    event loops). Failed fetches (None) are not cached.
+    """
+
+    def __init__(self, ttl=SEARCH_PAGE_CACHE_TTL, max_entries=SEARCH_PAGE_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    async def get_or_fetch(self, key, fetch):
+        """Return the cached page for `key`, or await `fetch()` to load it."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.time() - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                return entry[1]
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            # Shielded so a waiter giving up doesn't cancel the owner's future.
+            return await asyncio.shield(asyncio.wrap_future(future))
+
+        try:
+            data = await fetch()
+        except asyncio.CancelledError:
+            # The owner was cut off by a deadline; waiters see a failed page.
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_result(None)
+            raise
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._inflight.pop(key, None)
+            if data is not None:
+                self._entries[key] = (time.time(), data)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        future.set_result(data)
+        return data
+
+
+# Shared by every detector in the process (the web interface builds one per request).
+_SEARCH_PAGE_CACHE = _SearchPageCache()
+_FEATURED_SPECIALS_CACHE = _SearchPageCache(ttl=FEATURED_CATEGORIES_TTL, max_entries=1)
+
+# Steam tag ID -> English name, fetched once per process from GetTagList
+# (only needed for IDs missing from the bundled steam_tags table).
+_TAG_NAMES = {}
+_TAG_NAMES_LOCK = threading.Lock()
+_TAG_NAMES_ATTEMPTED = threading.Event()
+
+_STEAM_HTTP_ENGINE = None
+_STEAM_HTTP_ENGINE_LOCK = threading.Lock()
+
+
+def get_steam_http_engine():
+    """Process-wide async HTTP engine with the Steam store headers/cookies."""
+    global _STEAM_HTTP_ENGINE
+    with _STEAM_HTTP_ENGINE_LOCK:
+        if _STEAM_HTTP_ENGINE is None:
+            _STEAM_HTTP_ENGINE = AsyncHTTPEngine(
+                headers=STEAM_HTTP_HEADERS, cookies=STEAM_HTTP_COOKIES
+            )
+        return _STEAM_HTTP_ENGINE
+
+
+class _FetchBudget:
+    """Wall-clock budget shared by the stages of one get_all_deals call.
+
+    Stages clip their own timeouts to what is left, give up when it runs
+    out, and record themselves in `cut_short` so callers can tell a partial
+    refresh from a complete one.
+    """
+
+    def __init__(self, deadline=None):
+        self.deadline = deadline
+        self.started = time.monotonic()
+        self.stage_seconds = {}
+        self.cut_short = []
+
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    def remaining(self):
+        """Seconds left (None without a deadline)."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - self.elapsed())
+
+    def timeout(self, cap):
+        """`cap` clipped to the remaining budget."""
+        remaining = self.remaining()
+        return cap if remaining is None else min(cap, remaining)
+
+    def expired(self):
+        return self.remaining() == 0
+
+    def mark_cut_short(self, stage):
+        if stage not in self.cut_short:
+            self.cut_short.append(stage)
+
+    @contextmanager
+    def stage(self, name):
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.stage_seconds[name] = round(time.monotonic() - started, 2)
+
+    def report(self, deal_count):
+        return {
+            'deadline': self.deadline,
+            'elapsed': round(self.elapsed(), 2),
+            'deals': deal_count,
+            'stages': dict(self.stage_seconds),
+            'cut_short': list(self.cut_short),
+        }
+
 
 class SteamDealDetector:
     """Steam deal detector using multiple methods including API calls."""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-        })
-        # Bypass Steam's age-check interstitial so store pages return full
-        # content (descriptions and user tags) instead of the age gate.
-        self.session.cookies.set('birthtime', '568022401')
-        self.session.cookies.set('mature_content', '1')
-        self.session.cookies.set('wants_mature_content', '1')
+    def __init__(
+        self,
+        enrich_deadline=DESCRIPTION_ENRICH_DEADLINE,
+        app_info_cache=None,
+        engine=None,
+        state_cache=None,
+    ):
         # Cached total number of specials so we know the valid random offset range.
         self._total_specials_count = None
         # Cached active seasonal sale name (e.g. "Steam Summer Sale"), fetched once.
         self._active_sale_name = _UNSET
+        # Overall time budget (seconds) for one description enrichment pass.
+        self.enrich_deadline = enrich_deadline
+        # Persistent description/tags cache keyed by app ID (shared across runs).
+        self.app_info_cache = app_info_cache or get_app_info_cache()
+        # Small TTL'd state persisted across runs (featured specials, ...).
+        self.state_cache = state_cache or get_state_cache()
+        # Pooled asyncio HTTP engine; the fan-out methods below run on it
+        # through `self.aio` and block until it's done.
+        self.engine = engine or get_steam_http_engine()
+        self.aio = AsyncSteamDealDetector(self)
+        # Timing of the last get_all_deals call (see _FetchBudget.report).
+        self.last_fetch_report = None
+
+    def _run(self, coro):
+        """Run one of `self.aio`'s coroutines from synchronous code."""
+        return self.engine.run(coro)
         
     def get_steam_api_deals(self):
         """Get deals using Steam's API."""
-        try:
-            # Steam API endpoint for specials
-            url = "https://store.steampowered.com/api/featuredcategories/?cc=us&l=english"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            deals = []
-            
-            # Look for specials in the API response
-            if 'specials' in data and 'items' in data['specials']:
-                for item in data['specials']['items'][:10]:
-                    try:
-                        game_name = item.get('name', 'Unknown Game')
-                        discount_percent = item.get('discount_percent', 0)
-                        final_price = item.get('final_price', 0)
-                        original_price = item.get('original_price', 0)
-                        
-                        if discount_percent and discount_percent > 0:
-                            # Convert price from cents to dollars
-                            final_price_dollars = final_price / 100
-                            original_price_dollars = original_price / 100
-                            
-                            # Get game description (with fallback)
-                            steam_url = f"https://store.steampowered.com/app/{item.get('id', '')}/"
-                            try:
-                                game_info = self.get_game_info(game_name, steam_url)
-                                description = game_info['description']
-                            except:
-                                description = f"An amazing game with {discount_percent}% off! Don't miss this deal!"
-                            
-                            deal = {
-                                'name': game_name,
-                                'discount': f"-{discount_percent}%",
-                                'price': f"${final_price_dollars:.2f}",
-                                'original_price': f"${original_price_dollars:.2f}",
-                                'time_left': self._time_left_from_unix(item.get('discount_expiration')),
-                                'source': 'Steam Popular Deals',
-                                'description': description,
-                                'steam_url': steam_url
-                            }
-                            deals.append(deal)
-                    except Exception as e:
-                        continue
-                        
-            return deals
-            
-        except Exception as e:
-            print(f"Error fetching Steam API deals: {e}")
-            return []
-    
+        deals = self._run(self.aio.get_steam_api_deals())
+        return self._enrich_descriptions(deals, limit=len(deals))
+
+    def _fetch_featured_specials_items(self, timeout=15):
+        """Compact featured specials, revalidated with ETag / Last-Modified."""
+        return get_http_client().fetch_conditional(
+            STEAM_FEATURED_CATEGORIES_URL,
+            parse=lambda body: self._compact_featured_specials(json.loads(body)),
+            params={'cc': 'us', 'l': 'english'},
+            headers=STEAM_HTTP_HEADERS,
+            timeout=timeout,
+        )
+
+    @staticmethod
+    def _compact_featured_specials(data):
+        """Keep only what the deal list and countdowns need from featuredcategories."""
+        items = []
+        for item in ((data or {}).get('specials') or {}).get('items') or []:
+            if isinstance(item, dict) and item.get('id'):
+                items.append({field: item.get(field) for field in _FEATURED_ITEM_FIELDS})
+        return items
+
+    @staticmethod
+    def _featured_specials_from_items(items):
+        """{'items': [...], 'expirations': {app_id: unix_seconds}} for cached items."""
+        expirations = {}
+        for item in items:
+            try:
+                app_id = int(item.get('id') or 0)
+                expiration = int(item.get('discount_expiration') or 0)
+            except (TypeError, ValueError):
+                continue
+            if app_id and expiration:
+                expirations[app_id] = expiration
+        return {'items': items, 'expirations': expirations}
+
+    def _deals_from_featured_specials(self, featured):
+        """Deals from the cached featured 'specials' items (no description)."""
+        deals = []
+        if featured:
+            for item in featured['items'][:10]:
+                try:
+                    game_name = item.get('name', 'Unknown Game')
+                    discount_percent = item.get('discount_percent', 0)
+                    final_price = item.get('final_price', 0)
+                    original_price = item.get('original_price', 0)
+
+                    if discount_percent and discount_percent > 0:
+                        # The featured API already reports prices in cents.
+                        deal = Deal(
+                            name=game_name,
+                            discount_pct=discount_percent,
+                            price_cents=final_price,
+                            original_price_cents=original_price,
+                            discount_expiration=item.get('discount_expiration'),
+                            source='Steam Popular Deals',
+                            steam_url=f"https://store.steampowered.com/app/{item.get('id', '')}/",
+                        )
+                        deals.append(deal)
+                except Exception as e:
+                    continue
+        return deals
+
     def get_game_info(self, game_name, steam_url):
-        """Get game information from Steam store page."""
+        """Get game information (description + tags).
+
+        Order: app-info cache, batched JSON metadata, then the full store page
+        as a fallback (e.g. non-app URLs or apps GetItems doesn't return).
+        """
+        return self._run(self.aio.get_game_info(game_name, steam_url))
+
+    @staticmethod
+    def _clean_description(description):
+        """Collapse whitespace, cap at ~200 chars and end with punctuation."""
+        # Remove extra whitespace and newlines
+        description = ' '.join(description.split())
+
+        # Truncate if too long
+        if len(description) > 200:
+            description = description[:200].rsplit(' ', 1)[0] + "..."
+
+        # Ensure it ends with proper punctuation
+        if not description.endswith(('.', '!', '?')):
+            description += "."
+        return description
+
+    def _get_tag_names(self):
+        """Return the Steam tag ID -> name map (one GetTagList call per process)."""
+        with _TAG_NAMES_LOCK:
+            if _TAG_NAMES or _TAG_NAMES_ATTEMPTED.is_set():
+                return _TAG_NAMES
+            _TAG_NAMES_ATTEMPTED.set()
+            try:
+                response = get_http_client().get(
+                    STEAM_TAG_LIST_URL,
+                    params={'language': 'english'},
+                    headers=STEAM_HTTP_HEADERS,
+                    timeout=10,
+                )
+                response.raise_for_status()
+                for tag in (response.json().get('response') or {}).get('tags') or []:
+                    if tag.get('tagid') and tag.get('name'):
+                        _TAG_NAMES[int(tag['tagid'])] = tag['name']
+            except Exception as e:
+                print_progress(f"Could not load Steam tag names: {e}")
+            return _TAG_NAMES
+
+    def get_app_metadata(self, app_ids):
+        """Fetch short descriptions and top user tags for many apps at once.
+
+        Uses Steam's batched GetItems JSON endpoint (a few KB per batch instead
+        of a several-hundred-KB store page per app). Returns
+        {app_id: {'description', 'tags'}} for the apps Steam returned with a
+        description; results are written to the app-info cache.
+        """
+        return self._run(self.aio.get_app_metadata(app_ids))
+
+    @staticmethod
+    def _app_metadata_params(app_ids):
+        """GetItems query parameters for one batch of app IDs."""
+        request = {
+            'ids': [{'appid': app_id} for app_id in app_ids],
+            'context': {'language': 'english', 'country_code': 'US'},
+            'data_request': {
+                'include_basic_info': True,
+                'include_tag_count': APP_METADATA_TAG_COUNT,
+            },
+        }
+        return {'input_json': json.dumps(request, separators=(',', ':'))}
+
+    def _app_metadata_from_items(self, items):
+        """Turn GetItems store_items into {app_id: {'description', 'tags'}}
+        and write them to the app-info cache."""
+        results = {}
+        live_tag_names = None
+        for item in items:
+            app_id = item.get('appid') or item.get('id')
+            if not app_id or item.get('success') not in (None, 1):
+                continue
+            text = ((item.get('basic_info') or {}).get('short_description') or '').strip()
+            if not text:
+                continue
+            if live_tag_names is None:
+                live_tag_names = self._get_tag_names()
+            weighted = sorted(
+                item.get('tags') or [],
+                key=lambda tag: tag.get('weight') or 0,
+                reverse=True,
+            )
+            tag_ids = [tag.get('tagid') for tag in weighted] or item.get('tagids') or []
+            tags = tag_names([int(t) for t in tag_ids if t], extra=live_tag_names)
+            description = self._clean_description(html.unescape(text))
+            results[int(app_id)] = {'description': description, 'tags': tags}
+            self.app_info_cache.put(int(app_id), description=description, tags=tags)
+        return results
+
+    @staticmethod
+    def _fallback_game_info(game_name, steam_url):
+        """Name-based description used when the store page can't be read."""
+        return {
+            'description': f"Experience {game_name} - an exciting game now on sale!",
+            'steam_url': steam_url,
+            'tags': [],
+        }
+
+    def _game_info_from_store_page(self, page_html, game_name, steam_url):
+        """Get game information by parsing the full Steam store page."""
+        app_id = self._steam_app_id_from_url(steam_url)
         try:
-            response = self.session.get(steam_url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(page_html, 'html.parser')
             
             # Try to find game description in multiple ways
             description = None
@@ -256,17 +694,9 @@ class SteamDealDetector:
                         break
             
             # Clean up description
+            found_description = bool(description)
             if description:
-                # Remove extra whitespace and newlines
-                description = ' '.join(description.split())
-                
-                # Truncate if too long
-                if len(description) > 200:
-                    description = description[:200].rsplit(' ', 1)[0] + "..."
-                
-                # Ensure it ends with proper punctuation
-                if not description.endswith(('.', '!', '?')):
-                    description += "."
+                description = self._clean_description(description)
             else:
                 # Fallback description based on game name
                 description = f"Experience {game_name} - an exciting game now on sale!"
@@ -277,6 +707,10 @@ class SteamDealDetector:
                 tags = [g.get_text(strip=True) for g in soup.select('a[href*="/genre/"]')]
             tags = [t for t in tags if t]
 
+            # Only cache real page content, never the name-based fallback.
+            if app_id and found_description:
+                self.app_info_cache.put(app_id, description=description, tags=tags)
+
             return {
                 'description': description,
                 'steam_url': steam_url,
@@ -285,20 +719,17 @@ class SteamDealDetector:
             
         except Exception as e:
             # Fallback description based on game name
-            return {
-                'description': f"Experience {game_name} - an exciting game now on sale!",
-                'steam_url': steam_url,
-                'tags': [],
-            }
+            return self._fallback_game_info(game_name, steam_url)
     
     def get_steam_specials_page(self):
         """Get deals from Steam's specials page with better parsing."""
+        deals = self._run(self.aio.get_steam_specials_page())
+        return self._enrich_descriptions(deals, limit=len(deals))
+
+    def _deals_from_specials_page(self, page_html):
+        """Deals from the /specials/ page HTML (no description)."""
         try:
-            url = "https://store.steampowered.com/specials/?cc=us"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(page_html, 'html.parser')
             deals = []
             
             # Look for game containers with more specific selectors
@@ -353,18 +784,13 @@ class SteamDealDetector:
                     if len(game_name) < 3:
                         continue
                     
-                    # Get game description
-                    game_info = self.get_game_info(game_name, steam_url)
-                    
-                    deal = {
-                        'name': game_name,
-                        'discount': discount,
-                        'price': price,
-                        'original_price': None,
-                        'source': 'Steam Daily Deals',
-                        'description': game_info['description'],
-                        'steam_url': steam_url
-                    }
+                    deal = Deal(
+                        name=game_name,
+                        discount_pct=parse_discount_percent(discount),
+                        price_cents=parse_price_cents(price),
+                        source='Steam Daily Deals',
+                        steam_url=steam_url,
+                    )
                     deals.append(deal)
                     
                 except Exception as e:
@@ -373,17 +799,18 @@ class SteamDealDetector:
             return deals
             
         except Exception as e:
-            print(f"Error fetching Steam specials: {e}")
+            print(f"Error parsing Steam specials: {e}")
             return []
     
     def get_steam_search_deals(self):
         """Get deals from Steam search with better parsing."""
+        deals = self._run(self.aio.get_steam_search_deals())
+        return self._enrich_descriptions(deals, limit=len(deals))
+
+    def _deals_from_search_page(self, page_html):
+        """Deals from the full /search/ page HTML (no description)."""
         try:
-            url = "https://store.steampowered.com/search/?sort_by=Reviews_DESC&specials=1&cc=us"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(page_html, 'html.parser')
             deals = []
             
             # Look for game containers with more specific selectors
@@ -426,18 +853,13 @@ class SteamDealDetector:
                     if len(game_name) < 3:
                         continue
                     
-                    # Get game description
-                    game_info = self.get_game_info(game_name, steam_url)
-                    
-                    deal = {
-                        'name': game_name,
-                        'discount': discount,
-                        'price': price,
-                        'original_price': None,
-                        'source': 'Steam Featured Deals',
-                        'description': game_info['description'],
-                        'steam_url': steam_url
-                    }
+                    deal = Deal(
+                        name=game_name,
+                        discount_pct=parse_discount_percent(discount),
+                        price_cents=parse_price_cents(price),
+                        source='Steam Featured Deals',
+                        steam_url=steam_url,
+                    )
                     deals.append(deal)
                     
                 except Exception as e:
@@ -446,7 +868,7 @@ class SteamDealDetector:
             return deals
             
         except Exception as e:
-            print(f"Error fetching Steam search deals: {e}")
+            print(f"Error parsing Steam search deals: {e}")
             return []
     
     def get_active_sale_name(self):
@@ -454,37 +876,40 @@ class SteamDealDetector:
 
         Fetches the store homepage once and looks for a seasonal sale title
         (e.g. "Summer Sale"). Returns a label like "Steam Summer Sale", or
-        None if no seasonal sale is detected. Cached for the run.
+        None if no seasonal sale is detected. Cached for the run and in the
+        state file for ACTIVE_SALE_NAME_TTL.
         """
         if self._active_sale_name is not _UNSET:
             return self._active_sale_name
+        return self._run(self.aio.get_active_sale_name())
+
+    def _fetch_homepage_sale_name(self, timeout=10):
+        """Sale name from the store homepage; an unchanged page (304) isn't parsed again."""
+        return get_http_client().fetch_conditional(
+            STEAM_STORE_HOME_URL,
+            parse=self._sale_name_from_homepage,
+            headers=STEAM_HTTP_HEADERS,
+            cookies=STEAM_HTTP_COOKIES,
+            timeout=timeout,
+        )
 
-        self._active_sale_name = None
-        try:
-            response = self.session.get(
-                "https://store.steampowered.com/", timeout=10
-            )
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            # Prefer prominent banner/title text over generic body text.
-            candidates = []
-            for sel in ('title', 'h1', 'h2', '.salepage_header', '[class*="sale_"]'):
-                candidates.extend(e.get_text(' ', strip=True) for e in soup.select(sel))
-            candidates.append(soup.get_text(' ', strip=True))
-
-            for text in candidates:
-                match = SEASONAL_SALE_PATTERN.search(text or '')
-                if match:
-                    phrase = match.group(0).strip()
-                    phrase = re.sub(r'\s+', ' ', phrase).title()
-                    label = phrase if phrase.lower().startswith('steam') else f"Steam {phrase}"
-                    self._active_sale_name = label
-                    print_progress(f"Active sale detected: {label}")
-                    break
-        except Exception as e:
-            print(f"Could not check for active sale: {e}")
-
-        return self._active_sale_name
+    @staticmethod
+    def _sale_name_from_homepage(page_html):
+        """Return "Steam <Season> Sale" if the store homepage announces one."""
+        soup = BeautifulSoup(page_html, 'html.parser')
+        # Prefer prominent banner/title text over generic body text.
+        candidates = []
+        for sel in ('title', 'h1', 'h2', '.salepage_header', '[class*="sale_"]'):
+            candidates.extend(e.get_text(' ', strip=True) for e in soup.select(sel))
+        candidates.append(soup.get_text(' ', strip=True))
+
+        for text in candidates:
+            match = SEASONAL_SALE_PATTERN.search(text or '')
+            if match:
+                phrase = match.group(0).strip()
+                phrase = re.sub(r'\s+', ' ', phrase).title()
+                return phrase if phrase.lower().startswith('steam') else f"Steam {phrase}"
+        return None
 
     @staticmethod
     def _tag_to_hashtag(tag):
@@ -520,12 +945,21 @@ class SteamDealDetector:
                 break
         return hashtags
 
-    def _fetch_search_results_json(self, start=0, count=50, sort_by="", query="", tags=""):
+    def _fetch_search_results_json(
+        self, start=0, count=50, sort_by="", query="", tags="", timeout=SEARCH_PAGE_TIMEOUT
+    ):
         """Call Steam's paginated search-results JSON endpoint.
 
         Returns the parsed JSON dict (with 'total_count' and 'results_html'),
-        or None on failure.
+        or None on failure. Pages are served from the shared search-page cache
+        when the same slice was fetched in the last SEARCH_PAGE_CACHE_TTL seconds.
         """
+        return self._run(self.aio.fetch_search_results_json(
+            start=start, count=count, sort_by=sort_by, query=query, tags=tags, timeout=timeout,
+        ))
+
+    @staticmethod
+    def _search_results_params(start=0, count=50, sort_by="", query="", tags=""):
         params = {
             'term': query,
             'start': start,
@@ -540,84 +974,129 @@ class SteamDealDetector:
             params['sort_by'] = sort_by
         if tags:
             params['tags'] = tags
-        try:
-            response = self.session.get(
-                STEAM_SEARCH_RESULTS_URL, params=params, timeout=15
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            print(f"Error fetching Steam search results JSON: {e}")
-            return None
+        return params
 
     def get_total_specials_count(self):
-        """Return (and cache) how many specials Steam currently lists."""
+        """Return (and cache, see TOTAL_SPECIALS_COUNT_TTL) how many specials Steam currently lists."""
         if self._total_specials_count:
             return self._total_specials_count
-        data = self._fetch_search_results_json(start=0, count=1)
-        if data and isinstance(data.get('total_count'), int):
-            self._total_specials_count = data['total_count']
-        return self._total_specials_count or 0
+        return self._run(self.aio.get_total_specials_count())
 
     def _parse_search_results_html(self, results_html, source_label=DEFAULT_SOURCE_LABEL):
-        """Parse the 'results_html' fragment into deal dicts (no description)."""
-        soup = BeautifulSoup(results_html, 'html.parser')
-        deals = []
+        """Parse the 'results_html' fragment into deals (no description).
 
-        for row in soup.select('a.search_result_row'):
+        Tags, review summary and item type come straight from the rows, so
+        hashtags work without loading any store page.
+        """
+        rows = _search_rows_lxml(results_html) if _HAS_LXML else _search_rows_soup(results_html)
+        deals = []
+        for attrs, fields in rows:
             try:
-                title_elem = row.select_one('span.title')
-                if not title_elem:
-                    continue
-                game_name = self._clean_game_name(title_elem.get_text(strip=True))
-                if len(game_name) < 3:
-                    continue
+                deal = self._deal_from_search_row(attrs, fields, source_label)
+            except Exception:
+                continue
+            if deal:
+                deals.append(deal)
+        self._apply_row_tag_names(deals)
+        return deals
 
-                discount_elem = row.select_one('div.discount_pct')
-                discount = discount_elem.get_text(strip=True) if discount_elem else None
-                if not discount or not re.search(r'-\d+%', discount):
-                    continue
-                discount = re.search(r'(-\d+%)', discount).group(1)
+    def _apply_row_tag_names(self, deals):
+        """Turn each deal's row tag IDs into names (bundled table first)."""
+        live_tag_names = None
+        if any(unknown_tag_ids(deal.tag_ids) for deal in deals):
+            live_tag_names = self._get_tag_names()
+        for deal in deals:
+            if deal.tag_ids and not deal.tags:
+                deal.tags = tag_names(deal.tag_ids, extra=live_tag_names)
 
-                price_elem = row.select_one('div.discount_final_price')
-                price_match = re.search(r'(\$\d[\d,]*\.?\d*)', price_elem.get_text()) if price_elem else None
-                if not price_match:
-                    continue
-                price = price_match.group(1)
+    def _deal_from_search_row(self, attrs, fields, source_label):
+        """Build a Deal from one search row's attributes and field texts."""
+        title = fields.get('title')
+        if title is None:
+            return None
+        game_name = self._clean_game_name(title)
+        if len(game_name) < 3:
+            return None
 
-                orig_elem = row.select_one('div.discount_original_price')
-                orig_match = re.search(r'(\$\d[\d,]*\.?\d*)', orig_elem.get_text()) if orig_elem else None
-                original_price = orig_match.group(1) if orig_match else None
+        discount_match = _DISCOUNT_TEXT_RE.search(fields.get('discount_pct') or '')
+        if not discount_match:
+            return None
 
-                steam_url = (row.get('href') or '').split('?')[0]
-                appid = row.get('data-ds-appid')
-                if appid and '/app/' not in steam_url:
-                    steam_url = f"https://store.steampowered.com/app/{appid}/"
-                if not steam_url:
-                    continue
+        price_match = _USD_PRICE_RE.search(fields.get('discount_final_price') or '')
+        if not price_match:
+            return None
 
-                deals.append({
-                    'name': game_name,
-                    'discount': discount,
-                    'price': price,
-                    'original_price': original_price,
-                    'source': source_label,
-                    'description': None,
-                    'steam_url': steam_url,
-                    'tags': [],
-                })
-            except Exception:
-                continue
+        orig_match = _USD_PRICE_RE.search(fields.get('discount_original_price') or '')
 
-        return deals
+        steam_url = (attrs.get('href') or '').split('?')[0]
+        appid = attrs.get('data-ds-appid')
+        if appid and '/app/' not in steam_url:
+            steam_url = f"https://store.steampowered.com/app/{appid}/"
+        if not steam_url:
+            return None
 
-    def _get_specials_page(self, start=0, count=50, sort_by=""):
-        data = self._fetch_search_results_json(start=start, count=count, sort_by=sort_by)
-        if not data or not data.get('results_html'):
-            return []
+        summary, percent, review_count = _parse_review_tooltip(fields.get('search_review_summary'))
+        return Deal(
+            name=game_name,
+            discount_pct=parse_discount_percent(discount_match.group(1)),
+            price_cents=parse_price_cents(price_match.group(1)),
+            original_price_cents=parse_price_cents(orig_match.group(1)) if orig_match else None,
+            source=source_label,
+            steam_url=steam_url,
+            tag_ids=parse_tag_ids(attrs.get('data-ds-tagids')),
+            item_type=_search_row_item_type(attrs),
+            review_summary=summary,
+            review_percent=percent,
+            review_count=review_count,
+        )
+
+    def _get_specials_page(self, start=0, count=50, sort_by="", tags=""):
+        return self._get_specials_pages([(sort_by, start, count, tags)])
+
+    def _fetch_specials_pages(self, slices, timeout=SEARCH_PAGE_TIMEOUT):
+        """Fetch search slices concurrently and parse them in slice order.
+
+        Each slice is a ``(sort_by, start, count, tags)`` tuple. Returns one
+        deal list per slice (empty for pages that failed). The active-sale
+        lookup for the source label runs alongside the page requests.
+        """
+        return self._run(self.aio.fetch_specials_pages(slices, timeout=timeout))
+
+    def _parse_search_pages(self, pages, source_label):
+        return [
+            self._parse_search_results_html(data['results_html'], source_label=source_label)
+            if data and data.get('results_html') else []
+            for data in pages
+        ]
 
-        source_label = self.get_active_sale_name() or DEFAULT_SOURCE_LABEL
-        return self._parse_search_results_html(data['results_html'], source_label=source_label)
+    def _get_specials_pages(self, slices, timeout=SEARCH_PAGE_TIMEOUT):
+        """Concurrently fetch search slices and return their deals merged in order."""
+        return list(itertools.chain.from_iterable(
+            self._fetch_specials_pages(slices, timeout=timeout)
+        ))
+
+    @staticmethod
+    def _popular_page_slices(k, count, jitters=(0, 10, 25)):
+        """Random POPULAR_SEARCH_PAGES slices with a light start jitter."""
+        pages = random.sample(POPULAR_SEARCH_PAGES, k=min(k, len(POPULAR_SEARCH_PAGES)))
+        return [
+            (sort_by, max(0, start + random.choice(jitters)), count, "")
+            for sort_by, start in pages
+        ]
+
+    def _random_offset_slices(self, n, count=50, offset_limit=1200):
+        """`n` slices at random offsets across the specials list (random sorts)."""
+        total = self.get_total_specials_count()
+        max_start = min(max(0, (total or 1000) - count), offset_limit)
+        return [
+            (
+                random.choice(["Reviews_DESC", "", "Released_DESC"]),
+                random.randint(0, max_start) if max_start > 0 else 0,
+                count,
+                "",
+            )
+            for _ in range(n)
+        ]
 
     def search_discounted_games(self, keyword, count=10):
         """Search Steam specials for discounted games matching a keyword."""
@@ -721,13 +1200,11 @@ class SteamDealDetector:
             if sale_value is None:
                 continue
 
-            price = f"${sale_value:.2f}"
-            original_price = None
-            discount = "-0%"
+            original_price_cents = None
+            discount_pct = 0
             if regular_value and regular_value > sale_value:
-                original_price = f"${regular_value:.2f}"
+                original_price_cents = parse_price_cents(regular_value)
                 discount_pct = round((1 - (sale_value / regular_value)) * 100)
-                discount = f"-{discount_pct}%"
 
             description = (
                 item.get("description")
@@ -740,18 +1217,18 @@ class SteamDealDetector:
             nsuid = str(item.get("nsuid") or item.get("ns_uid") or "").strip()
 
             deals.append(
-                {
-                    "name": name,
-                    "discount": discount,
-                    "price": price,
-                    "original_price": original_price,
-                    "source": "Nintendo eShop US",
-                    "time_left": self._nintendo_time_left_text(sale_end_text),
-                    "description": description,
-                    "steam_url": url,
-                    "nsuid": nsuid,
-                    "tags": ["NintendoSwitch", "Nintendo"],
-                }
+                Deal(
+                    name=name,
+                    discount_pct=discount_pct,
+                    price_cents=parse_price_cents(sale_value),
+                    original_price_cents=original_price_cents,
+                    source="Nintendo eShop US",
+                    discount_expiration=self._nintendo_sale_end_timestamp(sale_end_text),
+                    description=description,
+                    steam_url=url,
+                    nsuid=nsuid,
+                    tags=["NintendoSwitch", "Nintendo"],
+                )
             )
         return deals
 
@@ -792,30 +1269,29 @@ class SteamDealDetector:
 
         sale_end = getattr(price, "sale_end", None)
         title = getattr(game, "title", "Nintendo Deal")
-        return {
-            "name": title,
-            "discount": f"-{discount_pct}%",
-            "price": f"${sale_value:.2f}",
-            "original_price": f"${regular_value:.2f}" if regular_value else None,
-            "source": "Nintendo eShop US",
-            "time_left": self._nintendo_time_left_text(sale_end),
-            "description": (
+        return Deal(
+            name=title,
+            discount_pct=discount_pct,
+            price_cents=parse_price_cents(sale_value),
+            original_price_cents=parse_price_cents(regular_value) if regular_value else None,
+            source="Nintendo eShop US",
+            discount_expiration=self._nintendo_sale_end_timestamp(sale_end),
+            description=(
                 " ".join(str(getattr(game, "description", "") or "").split())
                 or f"{title} is discounted on Nintendo eShop US."
             ),
-            "steam_url": url,
-            "nsuid": nsuid,
-            "tags": ["NintendoSwitch", "Nintendo"],
-        }
+            steam_url=url,
+            nsuid=nsuid,
+            tags=["NintendoSwitch", "Nintendo"],
+        )
 
     def get_nintendo_us_deals(self, keyword="", count=NINTENDO_DEAL_COUNT):
         """Get discounted Nintendo eShop US deals (separate from Steam)."""
-        if _HAS_NINTENDO_DEALS_LIB:
-            return self._get_nintendo_us_deals_from_library(keyword=keyword, count=count)
-        return self._get_nintendo_us_deals_from_api(keyword=keyword, count=count)
+        return self._run(self.aio.get_nintendo_us_deals(keyword=keyword, count=count))
 
-    def _get_nintendo_us_deals_from_api(self, keyword="", count=NINTENDO_DEAL_COUNT):
-        """Legacy Nintendo sales API (often unavailable). Used only without nintendeals."""
+    @staticmethod
+    def _nintendo_sales_request_params(keyword="", count=NINTENDO_DEAL_COUNT):
+        """One params dict per sales-API page to request (random offsets)."""
         keyword = (keyword or "").strip()
         pool_count = max(count * 4, 80)
         fetch_count = min(100, pool_count)
@@ -831,25 +1307,18 @@ class SteamDealDetector:
         else:
             offsets = sorted({random.randint(0, offset) for offset in (0, 40, 120, 200, 320)})
             params = {"count": fetch_count, "offset": 0}
+        return [dict(params, offset=offset) for offset in offsets]
 
+    def _nintendo_deals_from_sales_pages(self, pages, keyword="", count=NINTENDO_DEAL_COUNT):
+        """Parse, filter and finalize the sales-API JSON pages."""
+        keyword = (keyword or "").strip()
         all_items = []
-        try:
-            for offset in offsets:
-                request_params = dict(params)
-                request_params["offset"] = offset
-                response = self.session.get(
-                    NINTENDO_US_SALES_URL, params=request_params, timeout=5
-                )
-                response.raise_for_status()
-                data = response.json()
-                items = []
-                if isinstance(data, dict):
-                    items = data.get("items") or data.get("contents") or data.get("results") or []
-                if isinstance(items, list):
-                    all_items.extend(items)
-        except Exception as e:
-            print_progress(f"Nintendo US deals endpoint unavailable: {e}")
-            return []
+        for data in pages:
+            items = []
+            if isinstance(data, dict):
+                items = data.get("items") or data.get("contents") or data.get("results") or []
+            if isinstance(items, list):
+                all_items.extend(items)
 
         deals = self._parse_nintendo_sales_items(all_items)
 
@@ -919,38 +1388,8 @@ class SteamDealDetector:
             return []
 
     @staticmethod
-    def _time_left_text_from_datetime(end_dt):
-        if end_dt.tzinfo is None:
-            now = datetime.now()
-        else:
-            now = datetime.now(end_dt.tzinfo)
-        remaining = end_dt - now
-        if remaining.total_seconds() <= 0:
-            return "ended"
-
-        total_hours = int(remaining.total_seconds() // 3600)
-        total_days = total_hours // 24
-        if total_days >= 1:
-            return f"{total_days}d left"
-        if total_hours >= 2:
-            return f"{total_hours} hours left"
-        total_minutes = int(remaining.total_seconds() // 60)
-        if total_minutes >= 2:
-            return f"{total_minutes} minutes left"
-        return "ending soon"
-
-    @classmethod
-    def _time_left_from_unix(cls, unix_seconds):
-        if not unix_seconds:
-            return None
-        try:
-            end_dt = datetime.fromtimestamp(int(unix_seconds))
-        except Exception:
-            return None
-        return cls._time_left_text_from_datetime(end_dt)
-
-    @classmethod
-    def _nintendo_time_left_text(cls, sale_end):
+    def _nintendo_sale_end_timestamp(sale_end):
+        """Nintendo sale end (datetime or ISO string) -> Unix seconds."""
         if not sale_end:
             return None
 
@@ -968,7 +1407,10 @@ class SteamDealDetector:
         else:
             return None
 
-        return cls._time_left_text_from_datetime(end_dt)
+        try:
+            return int(end_dt.timestamp())
+        except (OverflowError, OSError, ValueError):
+            return None
 
     def format_nintendo_deal_tweet(self, deal, max_length: int = TWEET_MAX_LENGTH) -> str:
         name = deal["name"]
@@ -1001,15 +1443,20 @@ class SteamDealDetector:
 
     @staticmethod
     def _discount_percent_from_deal(deal):
-        match = re.search(r'(\d+)', deal.get('discount', '') or '')
-        return int(match.group(1)) if match else 0
+        if isinstance(deal, Deal):
+            return deal.discount_pct
+        return parse_discount_percent(deal.get('discount'))
 
     @staticmethod
-    def _price_usd_from_deal(deal):
-        match = re.search(r'(\d[\d,]*\.?\d*)', deal.get('price', '') or '')
-        if not match:
-            return None
-        return float(match.group(1).replace(',', ''))
+    def _price_cents_from_deal(deal):
+        if isinstance(deal, Deal):
+            return deal.price_cents
+        return parse_price_cents(deal.get('price'))
+
+    @classmethod
+    def _price_usd_from_deal(cls, deal):
+        cents = cls._price_cents_from_deal(deal)
+        return cents / 100 if cents is not None else None
 
     def _dedupe_deals_by_name(self, deals):
         unique_deals = []
@@ -1036,10 +1483,11 @@ class SteamDealDetector:
         return deals
 
     def _filter_deals_by_max_price(self, deals, max_price_usd):
+        max_cents = round(max_price_usd * 100)
         filtered = []
         for deal in deals:
-            price = self._price_usd_from_deal(deal)
-            if price is not None and price <= max_price_usd:
+            cents = self._price_cents_from_deal(deal)
+            if cents is not None and cents <= max_cents:
                 filtered.append(deal)
         return filtered
 
@@ -1050,14 +1498,13 @@ class SteamDealDetector:
         if not filtered:
             return []
 
-        bucket_edges = [0.0, 1.25, 2.5, 4.0, max_price_usd + 0.01]
+        # Bucket edges in cents: $0-1.25, $1.25-2.50, $2.50-4, $4-max.
+        bucket_edges = [0, 125, 250, 400, round(max_price_usd * 100) + 1]
         buckets = [[] for _ in range(len(bucket_edges) - 1)]
         for deal in filtered:
-            price = self._price_usd_from_deal(deal)
+            cents = self._price_cents_from_deal(deal)
             for index in range(len(buckets)):
-                low = bucket_edges[index]
-                high = bucket_edges[index + 1]
-                if low <= price < high:
+                if bucket_edges[index] <= cents < bucket_edges[index + 1]:
                     buckets[index].append(deal)
                     break
 
@@ -1098,44 +1545,27 @@ class SteamDealDetector:
 
         if mode_key == "big_names":
             # Different popular pages + light start jitter each load (Nintendo-style variety).
-            pages = random.sample(
-                POPULAR_SEARCH_PAGES, k=min(3, len(POPULAR_SEARCH_PAGES))
-            )
-            for sort_by, start in pages:
-                jitter = random.choice([0, 10, 25])
-                deals.extend(
-                    self._get_specials_page(
-                        start=max(0, start + jitter),
-                        count=25,
-                        sort_by=sort_by,
-                    )
-                )
+            slices = self._popular_page_slices(3, count=25)
             # One extra discovery slice so refreshes are not only the same top block.
-            discovery_sort = random.choice(DISCOVERY_SEARCH_SORTS)
-            discovery_start = random.choice([0, 50, 100, 150, 200])
-            deals.extend(
-                self._get_specials_page(
-                    start=discovery_start,
-                    count=25,
-                    sort_by=discovery_sort,
+            slices.append(
+                (
+                    random.choice(DISCOVERY_SEARCH_SORTS),
+                    random.choice([0, 50, 100, 150, 200]),
+                    25,
+                    "",
                 )
             )
+            deals.extend(self._get_specials_pages(slices))
         elif mode_key == "popular_indies":
             starts = random.sample([0, 25, 50, 75, 100, 125], k=2)
-            for start in starts:
-                data = self._fetch_search_results_json(
-                    start=start,
-                    count=max(pool_count // 2, 40),
-                    sort_by="Reviews_DESC",
-                    tags="492",
+            deals.extend(
+                self._get_specials_pages(
+                    [
+                        ("Reviews_DESC", start, max(pool_count // 2, 40), "492")
+                        for start in starts
+                    ]
                 )
-                if data and data.get("results_html"):
-                    source_label = self.get_active_sale_name() or DEFAULT_SOURCE_LABEL
-                    deals.extend(
-                        self._parse_search_results_html(
-                            data["results_html"], source_label
-                        )
-                    )
+            )
         elif mode_key == "hidden_gems":
             sort_by = random.choice(["Released_DESC", "Reviews_DESC", ""])
             total = self.get_total_specials_count()
@@ -1155,23 +1585,23 @@ class SteamDealDetector:
                     starts = [min_start]
             else:
                 starts = [150, 250]
-            for start in starts:
-                deals.extend(
-                    self._get_specials_page(
-                        start=start, count=page_count, sort_by=sort_by
-                    )
+            deals.extend(
+                self._get_specials_pages(
+                    [(sort_by, start, page_count, "") for start in starts]
                 )
+            )
         elif mode_key == "deep_discounts":
             # Randomized pages so the ≥70% pool is not always the same first 150.
             max_start = 500
             starts = sorted({random.randint(0, max_start) for _ in range(4)})
-            for start in starts:
-                sort_by = random.choice(["Reviews_DESC", "", "Released_DESC"])
-                deals.extend(
-                    self._get_specials_page(
-                        start=start, count=30, sort_by=sort_by
-                    )
+            deals.extend(
+                self._get_specials_pages(
+                    [
+                        (random.choice(["Reviews_DESC", "", "Released_DESC"]), start, 30, "")
+                        for start in starts
+                    ]
                 )
+            )
             deals = [
                 deal
                 for deal in deals
@@ -1179,26 +1609,9 @@ class SteamDealDetector:
             ]
         elif mode_key == "under_10":
             max_price = float(config.get("max_price_usd") or 10.0)
-            pages = random.sample(
-                POPULAR_SEARCH_PAGES, k=min(3, len(POPULAR_SEARCH_PAGES))
-            )
-            for sort_by, start in pages:
-                jitter = random.choice([0, 10, 25])
-                deals.extend(
-                    self._get_specials_page(
-                        start=max(0, start + jitter),
-                        count=25,
-                        sort_by=sort_by,
-                    )
-                )
-            total = self.get_total_specials_count()
-            max_start = min(max(0, (total or 1000) - 50), 1200)
-            for _ in range(3):
-                start = random.randint(0, max_start) if max_start > 0 else 0
-                sort_by = random.choice(["Reviews_DESC", "", "Released_DESC"])
-                deals.extend(
-                    self._get_specials_page(start=start, count=50, sort_by=sort_by)
-                )
+            slices = self._popular_page_slices(3, count=25)
+            slices.extend(self._random_offset_slices(3, count=50))
+            deals.extend(self._get_specials_pages(slices))
             deals = self._sample_deals_across_price_buckets(
                 deals, max_price, count=count
             )
@@ -1212,26 +1625,16 @@ class SteamDealDetector:
             return deals
         elif mode_key == "half_off_plus":
             min_discount = int(config.get("min_discount") or 50)
-            pages = random.sample(
-                POPULAR_SEARCH_PAGES, k=min(4, len(POPULAR_SEARCH_PAGES))
-            )
-            for sort_by, start in pages:
-                jitter = random.choice([0, 10, 25])
-                deals.extend(
-                    self._get_specials_page(
-                        start=max(0, start + jitter),
-                        count=30,
-                        sort_by=sort_by,
-                    )
-                )
-            discovery_start = random.choice([50, 100, 150, 200, 250])
-            deals.extend(
-                self._get_specials_page(
-                    start=discovery_start,
-                    count=30,
-                    sort_by=random.choice(DISCOVERY_SEARCH_SORTS),
+            slices = self._popular_page_slices(4, count=30)
+            slices.append(
+                (
+                    random.choice(DISCOVERY_SEARCH_SORTS),
+                    random.choice([50, 100, 150, 200, 250]),
+                    30,
+                    "",
                 )
             )
+            deals.extend(self._get_specials_pages(slices))
             deals = [
                 deal
                 for deal in deals
@@ -1251,27 +1654,9 @@ class SteamDealDetector:
 
         if category_key == "under_5":
             max_price = config["max_price_usd"]
-            pages = random.sample(
-                POPULAR_SEARCH_PAGES, k=min(3, len(POPULAR_SEARCH_PAGES))
-            )
-            for sort_by, start in pages:
-                jitter = random.choice([0, 10, 25])
-                deals.extend(
-                    self._get_specials_page(
-                        start=max(0, start + jitter),
-                        count=25,
-                        sort_by=sort_by,
-                    )
-                )
-
-            total = self.get_total_specials_count()
-            max_start = min(max(0, (total or 1000) - 50), 1200)
-            for _ in range(3):
-                start = random.randint(0, max_start) if max_start > 0 else 0
-                sort_by = random.choice(["Reviews_DESC", "", "Released_DESC"])
-                deals.extend(
-                    self._get_specials_page(start=start, count=50, sort_by=sort_by)
-                )
+            slices = self._popular_page_slices(3, count=25)
+            slices.extend(self._random_offset_slices(3, count=50))
+            deals.extend(self._get_specials_pages(slices))
 
             deals = self._sample_deals_across_price_buckets(
                 deals, max_price, count=count
@@ -1287,20 +1672,19 @@ class SteamDealDetector:
 
         # Tagged categories: sample more than one offset so reopening is not the same top 25.
         starts = random.sample([0, 25, 50, 75, 100, 125, 150], k=2)
-        for start in starts:
-            data = self._fetch_search_results_json(
-                start=start,
-                count=max(pool_count // 2, 40),
-                sort_by=random.choice(["Reviews_DESC", ""]),
-                tags=config["tags"],
-            )
-            if data and data.get("results_html"):
-                source_label = self.get_active_sale_name() or DEFAULT_SOURCE_LABEL
-                deals.extend(
-                    self._parse_search_results_html(
-                        data["results_html"], source_label
+        deals.extend(
+            self._get_specials_pages(
+                [
+                    (
+                        random.choice(["Reviews_DESC", ""]),
+                        start,
+                        max(pool_count // 2, 40),
+                        config["tags"],
                     )
-                )
+                    for start in starts
+                ]
+            )
+        )
 
         return self._finalize_collection_deals(deals, config["label"], count=count)
 
@@ -1310,16 +1694,13 @@ class SteamDealDetector:
         Most samples come from Steam's top review/relevance pages. A smaller
         discovery page still keeps room for under-the-radar games.
         """
-        total = self.get_total_specials_count()
-        page_count = max(20, count // 2)
-        all_deals = []
-        sampled_pages = []
+        return self._run(self.aio.get_random_specials(count=count))
 
+    @staticmethod
+    def _random_specials_slices(total, page_count):
+        """Three popular pages plus one discovery page at a random offset."""
         popular_pages = random.sample(POPULAR_SEARCH_PAGES, k=min(3, len(POPULAR_SEARCH_PAGES)))
-        for sort_by, start in popular_pages:
-            deals = self._get_specials_page(start=start, count=page_count, sort_by=sort_by)
-            all_deals.extend(deals)
-            sampled_pages.append(f"{sort_by or 'default'}@{start}:{len(deals)}")
+        slices = [(sort_by, start, page_count, "") for sort_by, start in popular_pages]
 
         sort_by = random.choice(DISCOVERY_SEARCH_SORTS)
         if total and total > page_count:
@@ -1327,9 +1708,17 @@ class SteamDealDetector:
             start = random.randint(0, max_start)
         else:
             start = 0
-        deals = self._get_specials_page(start=start, count=page_count, sort_by=sort_by)
-        all_deals.extend(deals)
-        sampled_pages.append(f"{sort_by or 'default'}@{start}:{len(deals)}")
+        slices.append((sort_by, start, page_count, ""))
+        return slices
+
+    @staticmethod
+    def _merge_sampled_pages(slices, pages, count):
+        """Blend the sampled pages in order, dedupe by name and log the mix."""
+        all_deals = []
+        sampled_pages = []
+        for (sort_by, start, _count, _tags), deals in zip(slices, pages):
+            all_deals.extend(deals)
+            sampled_pages.append(f"{sort_by or 'default'}@{start}:{len(deals)}")
 
         # Dedupe while preserving the blended popular/discovery order.
         unique_deals = []
@@ -1353,6 +1742,9 @@ class SteamDealDetector:
     def _ensure_real_description(self, deal):
         """Fetch a real Steam description for a single deal if it only has a
         generated/empty one (used for the deal we actually tweet)."""
+        if isinstance(deal, Deal) and deal.deferred:
+            # The resolver already fetches store info; don't ask twice.
+            return deal.resolve()
         if deal.get('description') and deal['description'] != self._generated_description(deal):
             return deal
         try:
@@ -1366,30 +1758,62 @@ class SteamDealDetector:
                 deal['description'] = self._generated_description(deal)
         return deal
 
-    def _enrich_descriptions(self, deals, limit=DESCRIPTION_ENRICH_LIMIT):
-        """Fetch real Steam descriptions for the first `limit` deals.
+    def _apply_cached_app_info(self, deals):
+        """Fill descriptions/tags from the app-info cache in one lookup.
 
-        The rest get a generated fallback so refreshes stay fast (each real
-        description is an extra page request).
+        Deals that already carry tags from their search row only need a cached
+        description. Returns the deals that still need a fetch.
         """
-        for i, deal in enumerate(deals):
-            if deal.get('description'):
+        app_ids = [self._steam_app_id_from_url(deal.get('steam_url')) for deal in deals]
+        cached = self.app_info_cache.get_many(app_id for app_id in app_ids if app_id)
+        misses = []
+        for deal, app_id in zip(deals, app_ids):
+            info = cached.get(app_id) if app_id else None
+            if not info or 'description' not in info or ('tags' not in info and not deal.get('tags')):
+                misses.append(deal)
                 continue
-            if i < limit:
-                try:
-                    info = self.get_game_info(deal['name'], deal['steam_url'])
-                    deal['description'] = info['description']
-                    if info.get('tags'):
-                        deal['tags'] = info['tags']
-                    continue
-                except Exception:
-                    pass
-            deal['description'] = self._generated_description(deal)
+            deal['description'] = info['description']
+            if info.get('tags'):
+                deal['tags'] = info['tags']
+        return misses
+
+    def _apply_app_metadata(self, deals, metadata):
+        """Fill descriptions/tags from a batched get_app_metadata result.
+
+        Returns the deals Steam had no JSON metadata for (HTML fallback).
+        """
+        misses = []
+        for deal in deals:
+            app_id = self._steam_app_id_from_url(deal.get('steam_url'))
+            info = metadata.get(app_id) if app_id else None
+            if not info:
+                misses.append(deal)
+                continue
+            deal['description'] = info['description']
+            if info['tags']:
+                deal['tags'] = info['tags']
+        return misses
+
+    def _enrich_descriptions(self, deals, limit=DESCRIPTION_ENRICH_LIMIT, deadline=None):
+        """Fetch real Steam descriptions for the first `limit` deals.
+
+        Cached apps and one batched metadata request cover most deals; the
+        remaining store pages are loaded concurrently on the HTTP engine.
+        Anything not back within `deadline` seconds (default:
+        `self.enrich_deadline`), and every deal past `limit`, gets a
+        generated fallback so refreshes stay fast.
+        """
+        return self._run(self.aio.enrich_descriptions(deals, limit=limit, deadline=deadline))
+
+    def _fill_generated_descriptions(self, deals):
+        for deal in deals:
+            if not deal.get('description'):
+                deal['description'] = self._generated_description(deal)
         return deals
 
     def get_fallback_deals(self):
         """Get some fallback deals if no real deals are found."""
-        return [
+        return [Deal.from_dict(deal) for deal in [
             {
                 'name': 'Steam Summer Sale',
                 'discount': '-50%',
@@ -1417,41 +1841,56 @@ class SteamDealDetector:
                 'description': 'Popular AAA titles at discounted prices!',
                 'steam_url': 'https://store.steampowered.com/specials/'
             }
-        ]
+        ]]
     
     def _clean_game_name(self, game_name):
         """Clean up game name by removing extra text."""
-        game_name = re.sub(r'\s+', ' ', game_name).strip()
-        game_name = re.sub(r'\s*\d{1,2}\s+\w{3,9},?\s+\d{4}.*$', '', game_name)
-        game_name = re.sub(r'\s*-\d+%.*$', '', game_name)
-        game_name = re.sub(r'\s*Rp\s*\d+.*$', '', game_name)
+        game_name = _SPACES_RE.sub(' ', game_name).strip()
+        game_name = _NAME_DATE_SUFFIX_RE.sub('', game_name)
+        game_name = _NAME_DISCOUNT_SUFFIX_RE.sub('', game_name)
+        game_name = _NAME_RUPIAH_SUFFIX_RE.sub('', game_name)
         game_name = game_name.strip()
         return game_name
     
-    def get_all_deals(self, sample_size=STEAM_DEAL_COUNT):
+    def get_all_deals(
+        self, sample_size=STEAM_DEAL_COUNT, deadline=ALL_DEALS_DEADLINE, lazy=False, on_deals=None
+    ):
         """Get a varied set of Steam deals.
 
         Primary source is Steam's paginated search-results JSON with a random
         offset, so every refresh samples a different slice of the thousands of
         available specials. The curated featured API and the legacy scrapers
         are used only as fallbacks if the JSON endpoint returns nothing.
-        """
-        print_progress("Searching for Steam deals...")
 
-        all_deals = list(self.get_random_specials(count=sample_size))
-
-        # Fallback chain if the paginated endpoint returned nothing.
-        if not all_deals:
-            print_progress("Paginated search returned nothing, trying other sources...")
-            all_deals.extend(self.get_steam_api_deals())
-            all_deals.extend(self.get_steam_specials_page())
-            all_deals.extend(self.get_steam_search_deals())
+        The whole refresh gets `deadline` seconds (None = no limit). When it
+        runs out, whatever deals are ready are returned and
+        `self.last_fetch_report['cut_short']` lists the stages that were
+        cut short ('search', 'fallback', 'time_left', 'descriptions').
+
+        With `lazy=True` the featured API and description enrichment are
+        skipped; each deal instead fetches its own description, tags and
+        time-left the first time a formatter reads them (see Deal.defer).
+
+        `on_deals(deals)` is called once, as soon as the first search page is
+        parsed, with a preview batch (separate copies, lazily enriched) so a
+        caller can show a deal while the full pool is still loading. It runs
+        on a worker thread and the refresh waits for it, so it should return
+        quickly (e.g. hand the deals to another thread); the call itself
+        still returns the complete pool. It isn't called when the paginated
+        search comes back empty.
+        """
+        return self._run(self.aio.get_all_deals(
+            sample_size=sample_size, deadline=deadline, lazy=lazy, on_deals=on_deals,
+        ))
 
-        if not all_deals:
-            print_progress("No real deals found, using fallback examples...")
-            all_deals = self.get_fallback_deals()
+    def _resolve_deferred_deal(self, deal):
+        """Deal.defer callback: enrich one deal on first use."""
+        self._run(self.aio.resolve_deal(deal))
 
-        # Remove duplicates based on game name.
+    @staticmethod
+    def _dedupe_and_shuffle(all_deals, sample_size):
+        """Drop repeated names, then shuffle within the popular and discovery
+        parts of the list."""
         unique_deals = []
         seen_names = set()
         for deal in all_deals:
@@ -1466,17 +1905,7 @@ class SteamDealDetector:
         discovery_deals = unique_deals[high_signal_count:]
         random.shuffle(high_signal_deals)
         random.shuffle(discovery_deals)
-        unique_deals = high_signal_deals + discovery_deals
-
-        # Enrich main Steam list with sale countdown when we can map app IDs
-        # to Steam's featured-categories discount expiration timestamps.
-        self._attach_time_left_from_featured_api(unique_deals)
-
-        # Fill in descriptions (real for the first few, generated for the rest).
-        self._enrich_descriptions(unique_deals)
-
-        print_progress(f"Found {len(unique_deals)} unique deals")
-        return unique_deals
+        return high_signal_deals + discovery_deals
 
     @staticmethod
     def _truncate_words(text: str, max_len: int) -> str:
@@ -1530,29 +1959,16 @@ class SteamDealDetector:
 
     @staticmethod
     def _steam_app_id_from_url(url: str):
-        match = re.search(r'store\.steampowered\.com/app/(\d+)', url or '')
-        return int(match.group(1)) if match else None
+        return steam_app_id_from_url(url)
 
     def _attach_time_left_from_featured_api(self, deals):
-        try:
-            response = self.session.get(
-                "https://store.steampowered.com/api/featuredcategories/?cc=us&l=english",
-                timeout=15,
-            )
-            response.raise_for_status()
-            data = response.json()
-        except Exception:
-            return
-
-        expiration_by_app_id = {}
-        for item in ((data.get("specials") or {}).get("items") or []):
-            app_id = item.get("id")
-            expiration = item.get("discount_expiration")
-            if app_id and expiration:
-                expiration_by_app_id[int(app_id)] = expiration
+        self._run(self.aio.attach_time_left_from_featured_api(deals))
 
+    def _apply_featured_expirations(self, deals, featured):
+        """Attach featuredcategories' discount_expiration stamps to the deals."""
+        expiration_by_app_id = featured['expirations'] if featured else {}
         for deal in deals:
-            if deal.get("time_left"):
+            if deal.get("discount_expiration") or deal.get("time_left"):
                 continue
             app_id = self._steam_app_id_from_url(deal.get("steam_url"))
             if not app_id:
@@ -1560,7 +1976,7 @@ class SteamDealDetector:
             expiration = expiration_by_app_id.get(app_id)
             if not expiration:
                 continue
-            deal["time_left"] = self._time_left_from_unix(expiration)
+            deal["discount_expiration"] = expiration
 
     def format_deal_tweet(self, deal, max_length: int = TWEET_MAX_LENGTH) -> str:
         """Format a single deal into a tweet (max 280 characters by default)."""
@@ -1608,8 +2024,12 @@ class SteamDealDetector:
         return self._fit_to_max_length(tweet, max_length)
     
     def get_best_deal_tweet(self):
-        """Get the best deal formatted for tweeting."""
-        deals = self.get_all_deals()
+        """Get the best deal formatted for tweeting.
+
+        Deals are loaded lazily, so only the deal that is tweeted gets its
+        description, tags and time-left fetched.
+        """
+        deals = self.get_all_deals(lazy=True)
         
         if not deals:
             return self._fit_to_max_length(
@@ -1617,23 +2037,15 @@ class SteamDealDetector:
             )
         
         # Sort deals by discount percentage (highest first)
-        def extract_discount_percent(deal):
-            try:
-                discount_text = deal['discount']
-                if '-' in discount_text and '%' in discount_text:
-                    return int(discount_text.replace('-', '').replace('%', ''))
-                return 0
-            except:
-                return 0
-        
-        deals.sort(key=extract_discount_percent, reverse=True)
+        deals.sort(key=self._discount_percent_from_deal, reverse=True)
         best_deal = self._ensure_real_description(deals[0])
         
         return self.format_deal_tweet(best_deal)
     
     def get_multiple_deals_tweet(self, max_deals=3):
-        """Get multiple deals in one tweet."""
-        deals = self.get_all_deals()
+        """Get multiple deals in one tweet (names and prices only, so no
+        descriptions are fetched)."""
+        deals = self.get_all_deals(lazy=True)
         
         if not deals:
             return self._fit_to_max_length(
@@ -1641,19 +2053,8 @@ class SteamDealDetector:
             )
         
         # Sort deals by discount percentage
-        def extract_discount_percent(deal):
-            try:
-                discount_text = deal['discount']
-                if '-' in discount_text and '%' in discount_text:
-                    return int(discount_text.replace('-', '').replace('%', ''))
-                return 0
-            except:
-                return 0
-        
-        deals.sort(key=extract_discount_percent, reverse=True)
+        deals.sort(key=self._discount_percent_from_deal, reverse=True)
         top_deals = deals[:max_deals]
-        for deal in top_deals:
-            self._ensure_real_description(deal)
         
         intro = "🎮 Top Steam Deals:\n\n"
         outro = "\n#SteamDeals #Gaming #Deals"
@@ -1684,6 +2085,540 @@ class SteamDealDetector:
         tweet = intro + body + outro
         return self._fit_to_max_length(tweet)
 
+
+class AsyncSteamDealDetector:
+    """asyncio side of SteamDealDetector.
+
+    Every network fan-out (search pages, metadata batches, store pages,
+    Nintendo sales pages) runs as coroutines on the shared AsyncHTTPEngine,
+    under its global and per-host limits. Parsing, caches and formatting stay
+    on the wrapped detector, whose synchronous methods submit these
+    coroutines and wait. Async callers use it directly::
+
+        detector = SteamDealDetector()
+        deals = await detector.aio.get_all_deals()
+    """
+
+    def __init__(self, detector):
+        self.detector = detector
+
+    @property
+    def engine(self):
+        return self.detector.engine
+
+    async def fetch_search_results_json(
+        self, start=0, count=50, sort_by="", query="", tags="", timeout=SEARCH_PAGE_TIMEOUT
+    ):
+        params = SteamDealDetector._search_results_params(start, count, sort_by, query, tags)
+
+        async def fetch():
+            try:
+                return await self.engine.get_json(
+                    STEAM_SEARCH_RESULTS_URL, params=params, timeout=timeout
+                )
+            except Exception as e:
+                print(f"Error fetching Steam search results JSON: {e}")
+                return None
+
+        key = (start, count, sort_by, query, tags, params['cc'])
+        return await _SEARCH_PAGE_CACHE.get_or_fetch(key, fetch)
+
+    async def get_total_specials_count(self, budget=None):
+        detector = self.detector
+        if detector._total_specials_count:
+            return detector._total_specials_count
+        cached = await self.engine.run_blocking(
+            detector.state_cache.get, TOTAL_SPECIALS_COUNT_STATE_KEY, TOTAL_SPECIALS_COUNT_TTL
+        )
+        if isinstance(cached, int) and cached > 0:
+            detector._total_specials_count = cached
+            return cached
+        timeout = budget.timeout(SEARCH_PAGE_TIMEOUT) if budget else SEARCH_PAGE_TIMEOUT
+        try:
+            # The request's timeout covers its retries too; wait_for also
+            # bounds the wait for a connection slot.
+            data = await asyncio.wait_for(
+                self.fetch_search_results_json(start=0, count=1, timeout=timeout),
+                timeout=budget.remaining() if budget else None,
+            )
+        except asyncio.TimeoutError:
+            if budget is not None:
+                budget.mark_cut_short('search')
+            return 0
+        if data and isinstance(data.get('total_count'), int):
+            detector._total_specials_count = data['total_count']
+            await self.engine.run_blocking(
+                detector.state_cache.put, TOTAL_SPECIALS_COUNT_STATE_KEY, data['total_count']
+            )
+        return detector._total_specials_count or 0
+
+    async def get_active_sale_name(self):
+        detector = self.detector
+        if detector._active_sale_name is not _UNSET:
+            return detector._active_sale_name
+        cached = await self.engine.run_blocking(
+            detector.state_cache.get, ACTIVE_SALE_NAME_STATE_KEY, ACTIVE_SALE_NAME_TTL, _UNSET
+        )
+        if cached is not _UNSET:
+            detector._active_sale_name = cached
+            return cached
+
+        detector._active_sale_name = None
+        try:
+            label = await self.engine.run_blocking(detector._fetch_homepage_sale_name, 10)
+            if label:
+                detector._active_sale_name = label
+                print_progress(f"Active sale detected: {label}")
+            # "No sale" is remembered too, so the homepage isn't refetched.
+            await self.engine.run_blocking(
+                detector.state_cache.put, ACTIVE_SALE_NAME_STATE_KEY, label
+            )
+        except Exception as e:
+            print(f"Could not check for active sale: {e}")
+        return detector._active_sale_name
+
+    async def _sale_name_within(self, timeout):
+        """get_active_sale_name(), or None if it takes longer than `timeout`."""
+        try:
+            return await asyncio.wait_for(asyncio.shield(self.get_active_sale_name()), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def fetch_specials_pages(
+        self, slices, timeout=SEARCH_PAGE_TIMEOUT, budget=None, on_first_page=None
+    ):
+        """With a `budget`, pages still loading when it runs out count as
+        failed and the 'search' stage is marked cut short.
+
+        `on_first_page(deals)` is called as soon as the first page with
+        results is parsed, while the other pages are still loading. The sale
+        name used as the deals' source waits at most SALE_NAME_TIMEOUT.
+        """
+        slices = list(slices)
+        if not slices:
+            return []
+        if budget is not None:
+            timeout = budget.timeout(timeout)
+        sale_task = asyncio.ensure_future(self._sale_name_within(
+            budget.timeout(SALE_NAME_TIMEOUT) if budget is not None else SALE_NAME_TIMEOUT
+        ))
+        page_tasks = [
+            asyncio.ensure_future(self.fetch_search_results_json(
+                start=start, count=count, sort_by=sort_by, tags=tags, timeout=timeout
+            ))
+            for sort_by, start, count, tags in slices
+        ]
+        first_task = None
+        if on_first_page is not None:
+            first_task = asyncio.ensure_future(
+                self._parse_first_page(page_tasks, sale_task, on_first_page)
+            )
+        _done, not_done = await asyncio.wait(
+            page_tasks, timeout=budget.remaining() if budget else None
+        )
+        for task in not_done:
+            task.cancel()
+        if budget is not None and not_done:
+            budget.mark_cut_short('search')
+        await asyncio.wait([sale_task])
+
+        def result(task):
+            if task in not_done or task.exception() is not None:
+                return None
+            return task.result()
+
+        first_page = None
+        if first_task is not None:
+            await asyncio.wait([first_task])
+            first_page = result(first_task)
+        source_label = result(sale_task) or DEFAULT_SOURCE_LABEL
+        # The page already parsed for the callback isn't parsed again.
+        pages = await self.engine.run_blocking(
+            self.detector._parse_search_pages,
+            [
+                None if first_page and i == first_page[0] else result(task)
+                for i, task in enumerate(page_tasks)
+            ],
+            source_label,
+        )
+        if first_page:
+            pages[first_page[0]] = first_page[1]
+        return pages
+
+    async def _parse_first_page(self, page_tasks, sale_task, on_first_page):
+        """Parse whichever page arrives first (with results) and report it.
+
+        Returns ``(page_index, deals)``, or None if no page had results.
+        The callback gets copies and runs on a worker thread (never the
+        engine loop). The first page is only returned once it is done, so
+        it should return quickly, e.g. by handing the deals to another thread.
+        """
+        pending = set(page_tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.cancelled() or task.exception() is not None:
+                    continue
+                data = task.result()
+                if not data or not data.get('results_html'):
+                    continue
+                await asyncio.wait([sale_task])
+                sale_name = None
+                if not sale_task.cancelled() and sale_task.exception() is None:
+                    sale_name = sale_task.result()
+                [deals] = await self.engine.run_blocking(
+                    self.detector._parse_search_pages, [data], sale_name or DEFAULT_SOURCE_LABEL
+                )
+                if not deals:
+                    continue
+                await self.engine.run_blocking(on_first_page, [deal.copy() for deal in deals])
+                return page_tasks.index(task), deals
+        return None
+
+    async def get_random_specials(self, count=STEAM_DEAL_COUNT, budget=None, on_first_page=None):
+        detector = self.detector
+        total = await self.get_total_specials_count(budget=budget)
+        slices = detector._random_specials_slices(total, page_count=max(20, count // 2))
+        pages = await self.fetch_specials_pages(slices, budget=budget, on_first_page=on_first_page)
+        return detector._merge_sampled_pages(slices, pages, count)
+
+    async def _fetch_app_metadata_batch(self, app_ids):
+        try:
+            data = await self.engine.get_json(
+                STEAM_STORE_ITEMS_URL,
+                params=SteamDealDetector._app_metadata_params(app_ids),
+                timeout=10,
+            )
+            return (data.get('response') or {}).get('store_items') or []
+        except Exception as e:
+            print_progress(f"Batched app metadata unavailable: {e}")
+            return []
+
+    async def get_app_metadata(self, app_ids):
+        app_ids = list(dict.fromkeys(int(app_id) for app_id in app_ids if app_id))
+        if not app_ids:
+            return {}
+        batches = await asyncio.gather(*(
+            self._fetch_app_metadata_batch(app_ids[offset:offset + APP_METADATA_BATCH_SIZE])
+            for offset in range(0, len(app_ids), APP_METADATA_BATCH_SIZE)
+        ))
+        items = [item for batch in batches for item in batch]
+        if not items:
+            return {}
+        return await self.engine.run_blocking(self.detector._app_metadata_from_items, items)
+
+    async def scrape_game_info(self, game_name, steam_url):
+        """Description and tags from the full store page (slowest path)."""
+        try:
+            page = await self.engine.get_text(steam_url, timeout=10)
+        except Exception:
+            return self.detector._fallback_game_info(game_name, steam_url)
+        return await self.engine.run_blocking(
+            self.detector._game_info_from_store_page, page, game_name, steam_url
+        )
+
+    async def get_game_info(self, game_name, steam_url):
+        detector = self.detector
+        app_id = detector._steam_app_id_from_url(steam_url)
+        cached = await self.engine.run_blocking(detector.app_info_cache.get, app_id) if app_id else None
+        if cached and 'description' in cached and 'tags' in cached:
+            return {
+                'description': cached['description'],
+                'steam_url': steam_url,
+                'tags': cached['tags'],
+            }
+
+        if app_id:
+            metadata = (await self.get_app_metadata([app_id])).get(app_id)
+            if metadata:
+                return {
+                    'description': metadata['description'],
+                    'steam_url': steam_url,
+                    'tags': metadata['tags'],
+                }
+
+        return await self.scrape_game_info(game_name, steam_url)
+
+    async def enrich_descriptions(
+        self, deals, limit=DESCRIPTION_ENRICH_LIMIT, deadline=None, budget=None
+    ):
+        """`deadline` covers the whole pass (metadata batch + store pages);
+        with a `budget` it is clipped to what is left of it."""
+        detector = self.detector
+        if deadline is None:
+            deadline = detector.enrich_deadline
+        if budget is not None:
+            deadline = budget.timeout(deadline)
+        loop = asyncio.get_running_loop()
+        ends_at = loop.time() + deadline
+
+        pending = [
+            deal for i, deal in enumerate(deals)
+            if i < limit and not deal.get('description')
+        ]
+        pending = await self.engine.run_blocking(detector._apply_cached_app_info, pending)
+        if pending:
+            try:
+                metadata = await asyncio.wait_for(
+                    self.get_app_metadata(
+                        detector._steam_app_id_from_url(deal.get('steam_url')) for deal in pending
+                    ),
+                    timeout=max(0.0, ends_at - loop.time()),
+                )
+            except asyncio.TimeoutError:
+                metadata = {}
+            pending = detector._apply_app_metadata(pending, metadata)
+        if pending:
+            tasks = {
+                asyncio.ensure_future(self.scrape_game_info(deal['name'], deal['steam_url'])): deal
+                for deal in pending
+            }
+            done, not_done = await asyncio.wait(tasks, timeout=max(0.0, ends_at - loop.time()))
+            for task in not_done:
+                task.cancel()
+            for task in done:
+                if task.exception() is not None:
+                    continue
+                info = task.result()
+                deal = tasks[task]
+                deal['description'] = info['description']
+                if info.get('tags'):
+                    deal['tags'] = info['tags']
+            if not_done:
+                if budget is not None:
+                    budget.mark_cut_short('descriptions')
+                print_progress(
+                    f"Description enrichment hit the {deadline:g}s deadline "
+                    f"({len(not_done)} left with generated text)"
+                )
+
+        return detector._fill_generated_descriptions(deals)
+
+    async def get_featured_specials(self, timeout=15):
+        """Featured specials and their app_id -> discount_expiration map.
+
+        Served from memory or the state file while younger than
+        FEATURED_CATEGORIES_TTL; concurrent callers share one download.
+        Returns None when the API can't be reached.
+        """
+        detector = self.detector
+
+        async def fetch():
+            items = await self.engine.run_blocking(
+                detector.state_cache.get, FEATURED_SPECIALS_STATE_KEY, FEATURED_CATEGORIES_TTL
+            )
+            if items is None:
+                try:
+                    items = await self.engine.run_blocking(detector._fetch_featured_specials_items, timeout)
+                except Exception as e:
+                    print(f"Error fetching Steam featured categories: {e}")
+                    return None
+                await self.engine.run_blocking(
+                    detector.state_cache.put, FEATURED_SPECIALS_STATE_KEY, items
+                )
+            return detector._featured_specials_from_items(items)
+
+        return await _FEATURED_SPECIALS_CACHE.get_or_fetch(FEATURED_SPECIALS_STATE_KEY, fetch)
+
+    async def attach_time_left_from_featured_api(self, deals, budget=None):
+        timeout = budget.timeout(15) if budget else 15
+        try:
+            featured = await asyncio.wait_for(self.get_featured_specials(timeout=timeout), timeout=timeout)
+        except asyncio.TimeoutError:
+            if budget is not None:
+                budget.mark_cut_short('time_left')
+            return
+        except Exception:
+            return
+        self.detector._apply_featured_expirations(deals, featured)
+
+    async def get_steam_api_deals(self, timeout=10):
+        featured = await self.get_featured_specials(timeout=timeout)
+        return self.detector._deals_from_featured_specials(featured)
+
+    async def get_steam_specials_page(self, timeout=10):
+        try:
+            page = await self.engine.get_text(
+                STEAM_SPECIALS_PAGE_URL, params={'cc': 'us'}, timeout=timeout
+            )
+        except Exception as e:
+            print(f"Error fetching Steam specials: {e}")
+            return []
+        return await self.engine.run_blocking(self.detector._deals_from_specials_page, page)
+
+    async def get_steam_search_deals(self, timeout=10):
+        try:
+            page = await self.engine.get_text(
+                STEAM_SEARCH_PAGE_URL,
+                params={'sort_by': 'Reviews_DESC', 'specials': 1, 'cc': 'us'},
+                timeout=timeout,
+            )
+        except Exception as e:
+            print(f"Error fetching Steam search deals: {e}")
+            return []
+        return await self.engine.run_blocking(self.detector._deals_from_search_page, page)
+
+    async def get_fallback_source_deals(self, sample_size=STEAM_DEAL_COUNT, budget=None):
+        """Race the legacy sources (featured API, specials page, search page).
+
+        The first source with FALLBACK_ENOUGH_DEALS (or `sample_size`) deals
+        wins and goes first; sources that already finished are appended in
+        chain order, the rest are cancelled. Deals come back without
+        descriptions so enrichment runs once, after dedupe.
+        """
+        timeout = budget.timeout(10) if budget else 10
+        tasks = [
+            asyncio.ensure_future(self.get_steam_api_deals(timeout=timeout)),
+            asyncio.ensure_future(self.get_steam_specials_page(timeout=timeout)),
+            asyncio.ensure_future(self.get_steam_search_deals(timeout=timeout)),
+        ]
+        enough = min(sample_size, FALLBACK_ENOUGH_DEALS)
+        results = {}
+        winner = None
+        pending = set(tasks)
+        while pending and winner is None:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=budget.remaining() if budget else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                if budget is not None:
+                    budget.mark_cut_short('fallback')
+                break
+            for task in done:
+                results[task] = task.result() if task.exception() is None else []
+                if winner is None and len(results[task]) >= enough:
+                    winner = task
+        for task in pending:
+            task.cancel()
+
+        order = ([winner] if winner else []) + [
+            task for task in tasks if task is not winner and task in results
+        ]
+        return [deal for task in order for deal in results[task]]
+
+    async def get_nintendo_us_deals(self, keyword="", count=NINTENDO_DEAL_COUNT):
+        detector = self.detector
+        if _HAS_NINTENDO_DEALS_LIB:
+            # nintendeals is a blocking client; it gets a worker thread.
+            return await self.engine.run_blocking(
+                detector._get_nintendo_us_deals_from_library, keyword=keyword, count=count
+            )
+
+        # Legacy Nintendo sales API (often unavailable). Pages load together.
+        results = await asyncio.gather(
+            *(
+                self.engine.get_json(NINTENDO_US_SALES_URL, params=params, timeout=5)
+                for params in detector._nintendo_sales_request_params(keyword, count)
+            ),
+            return_exceptions=True,
+        )
+        pages = [data for data in results if not isinstance(data, BaseException)]
+        if not pages:
+            print_progress(f"Nintendo US deals endpoint unavailable: {results[0]}")
+            return []
+        return detector._nintendo_deals_from_sales_pages(pages, keyword=keyword, count=count)
+
+    async def resolve_deal(self, deal):
+        """Fill a lazily loaded deal's description, tags and time-left.
+
+        Async code should await this before reading those fields; the sync
+        resolver Deal.defer installs can't run on the engine loop.
+        """
+        deal.defer(None)
+        info, _ = await asyncio.gather(
+            self.get_game_info(deal['name'], deal['steam_url']),
+            self.attach_time_left_from_featured_api([deal]),
+        )
+        if info.get('description'):
+            deal['description'] = info['description']
+        if info.get('tags'):
+            deal['tags'] = info['tags']
+        if not deal.get('description'):
+            deal['description'] = self.detector._generated_description(deal)
+        return deal
+
+    def _preview_callback(self, on_deals, budget):
+        """Wrap get_all_deals' `on_deals` for the first parsed search page."""
+        detector = self.detector
+
+        def first_page(deals):
+            # Cached details only (no requests); the rest loads on first use.
+            detector._apply_cached_app_info(deals)
+            for deal in deals:
+                if not deal.get('description'):
+                    deal.defer(detector._resolve_deferred_deal)
+            budget.stage_seconds['first_deals'] = round(budget.elapsed(), 2)
+            on_deals(deals)
+
+        return first_page
+
+    async def get_all_deals(
+        self, sample_size=STEAM_DEAL_COUNT, deadline=ALL_DEALS_DEADLINE, lazy=False, on_deals=None
+    ):
+        detector = self.detector
+        budget = _FetchBudget(deadline)
+        print_progress("Searching for Steam deals...")
+
+        with budget.stage('search'):
+            all_deals = list(await self.get_random_specials(
+                count=sample_size,
+                budget=budget,
+                on_first_page=self._preview_callback(on_deals, budget) if on_deals else None,
+            ))
+
+        # Fallback sources if the paginated endpoint returned nothing.
+        if not all_deals:
+            print_progress("Paginated search returned nothing, trying other sources...")
+            with budget.stage('fallback'):
+                if budget.expired():
+                    budget.mark_cut_short('fallback')
+                else:
+                    all_deals = await self.get_fallback_source_deals(sample_size, budget=budget)
+
+        if not all_deals and budget.cut_short:
+            # Out of time: an empty refresh beats tweeting placeholder deals.
+            detector.last_fetch_report = budget.report(0)
+            print_progress(
+                f"No deals within the {budget.deadline:g}s deadline "
+                f"(cut short: {', '.join(budget.cut_short)})"
+            )
+            return []
+
+        if not all_deals:
+            print_progress("No real deals found, using fallback examples...")
+            all_deals = detector.get_fallback_deals()
+
+        unique_deals = detector._dedupe_and_shuffle(all_deals, sample_size)
+
+        if lazy:
+            for deal in unique_deals:
+                if not deal.get('description'):
+                    deal.defer(detector._resolve_deferred_deal)
+            detector.last_fetch_report = budget.report(len(unique_deals))
+            print_progress(f"Found {len(unique_deals)} unique deals (details load on use)")
+            return unique_deals
+
+        # Enrich main Steam list with sale countdown when we can map app IDs
+        # to Steam's featured-categories discount expiration timestamps.
+        with budget.stage('time_left'):
+            await self.attach_time_left_from_featured_api(unique_deals, budget=budget)
+
+        # Fill in descriptions (real for the first few, generated for the rest).
+        with budget.stage('descriptions'):
+            await self.enrich_descriptions(unique_deals, budget=budget)
+
+        detector.last_fetch_report = budget.report(len(unique_deals))
+        if budget.cut_short:
+            print_progress(
+                f"Refresh returned partial results after {budget.elapsed():.1f}s "
+                f"(cut short: {', '.join(budget.cut_short)})"
+            )
+        print_progress(f"Found {len(unique_deals)} unique deals")
+        return unique_deals
+
+
 def main():
     """Test the Steam deal detector with API."""
     detector = SteamDealDetector()
@@ -0,0 +1,170 @@
+"""
+Bundled Steam user-tag ID -> English name table.
+
+Search result rows only carry numeric tag IDs (``data-ds-tagids``). The most
+common tags are listed here so hashtags can be built without any request;
+IDs missing from this table are resolved through Steam's GetTagList endpoint
+(one call per process, see ``SteamDealDetector._get_tag_names``).
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Mapping, Optional
+
+STEAM_TAG_NAMES: Dict[int, str] = {
+    9: "Strategy",
+    19: "Action",
+    21: "Adventure",
+    113: "Free to Play",
+    122: "RPG",
+    128: "Massively Multiplayer",
+    492: "Indie",
+    493: "Early Access",
+    597: "Casual",
+    599: "Simulation",
+    699: "Racing",
+    701: "Sports",
+    1036: "Education",
+    1621: "Music",
+    1625: "Platformer",
+    1628: "Metroidvania",
+    1643: "Building",
+    1644: "Driving",
+    1645: "Tower Defense",
+    1646: "Hack and Slash",
+    1654: "Relaxing",
+    1659: "Zombies",
+    1662: "Survival",
+    1663: "FPS",
+    1664: "Puzzle",
+    1666: "Card Game",
+    1667: "Horror",
+    1669: "Moddable",
+    1670: "4X",
+    1676: "RTS",
+    1677: "Turn-Based",
+    1678: "War",
+    1684: "Fantasy",
+    1685: "Co-op",
+    1687: "Stealth",
+    1693: "Classic",
+    1695: "Open World",
+    1697: "Third Person",
+    1698: "Point & Click",
+    1702: "Crafting",
+    1708: "Tactical",
+    1716: "Roguelike",
+    1718: "MOBA",
+    1719: "Comedy",
+    1720: "Dungeon Crawler",
+    1721: "Psychological Horror",
+    1734: "Fast-Paced",
+    1738: "Hidden Object",
+    1741: "Turn-Based Strategy",
+    1742: "Story Rich",
+    1743: "Fighting",
+    1752: "Rhythm",
+    1754: "MMORPG",
+    1755: "Space",
+    1756: "Great Soundtrack",
+    1773: "Arcade",
+    1774: "Shooter",
+    1775: "PvP",
+    3799: "Visual Novel",
+    3810: "Sandbox",
+    3834: "Exploration",
+    3839: "First-Person",
+    3841: "Local Co-Op",
+    3843: "Online Co-Op",
+    3859: "Multiplayer",
+    3871: "2D",
+    3877: "Precision Platformer",
+    3878: "Competitive",
+    3916: "Old School",
+    3942: "Sci-fi",
+    3959: "Roguelite",
+    3964: "Pixel Graphics",
+    3968: "Physics",
+    3978: "Survival Horror",
+    3987: "Historical",
+    4004: "Retro",
+    4026: "Difficult",
+    4085: "Anime",
+    4106: "Action-Adventure",
+    4136: "Funny",
+    4150: "World War II",
+    4158: "Beat 'em up",
+    4166: "Atmospheric",
+    4168: "Military",
+    4172: "Medieval",
+    4175: "Realistic",
+    4182: "Singleplayer",
+    4191: "3D",
+    4231: "Action RPG",
+    4255: "Shoot 'Em Up",
+    4295: "Futuristic",
+    4305: "Colorful",
+    4325: "Turn-Based Combat",
+    4342: "Dark",
+    4345: "Gore",
+    4364: "Grand Strategy",
+    4604: "Dark Fantasy",
+    4667: "Violent",
+    4726: "Cute",
+    4747: "Character Customization",
+    4885: "Bullet Hell",
+    5125: "Procedural Generation",
+    5350: "Family Friendly",
+    5379: "2D Platformer",
+    5395: "3D Platformer",
+    5611: "Mature",
+    5716: "Mystery",
+    5984: "Drama",
+    6426: "Choices Matter",
+    6730: "PvE",
+    6971: "Multiple Endings",
+    7208: "Female Protagonist",
+    7332: "Base Building",
+    7368: "Local Multiplayer",
+    8945: "Resource Management",
+    9551: "Dating Sim",
+    10235: "Life Sim",
+    11014: "Interactive Fiction",
+    12472: "Management",
+    14139: "Turn-Based Tactics",
+    21978: "VR",
+    29482: "Souls-like",
+    32322: "Deckbuilding",
+    42804: "Action Roguelike",
+    220585: "Colony Sim",
+    1100689: "Open World Survival Craft",
+}
+
+
+def parse_tag_ids(text: Optional[str]) -> List[int]:
+    """'[1716,4231,19]' -> [1716, 4231, 19]. Ignores anything non-numeric."""
+    if not text:
+        return []
+    ids = []
+    for part in text.strip().strip("[]").split(","):
+        part = part.strip()
+        if part.isdigit():
+            ids.append(int(part))
+    return ids
+
+
+def tag_names(tag_ids: Iterable[int], extra: Optional[Mapping[int, str]] = None) -> List[str]:
+    """Map tag IDs to names, keeping order and skipping unknown IDs.
+
+    ``extra`` (the live GetTagList map) wins over the bundled table when given.
+    """
+    names = []
+    for tag_id in tag_ids:
+        name = (extra or {}).get(tag_id) or STEAM_TAG_NAMES.get(tag_id)
+        if name:
+            names.append(name)
+    return names
+
+
+def unknown_tag_ids(tag_ids: Iterable[int]) -> List[int]:
+    return [tag_id for tag_id in tag_ids if tag_id not in STEAM_TAG_NAMES]